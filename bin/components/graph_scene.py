@@ -5,7 +5,9 @@ Graph Scene
 Contains nodes, connections, grid and other elements
 """
 
+import hashlib
 import json
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any
 from shiboken6 import isValid
 
@@ -17,12 +19,96 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QVBoxLayout, QPushButton, QMessageBox, QLabel
 )
 
-from bin.core.logger import log_info, log_error, log_debug, log_warning, log_success
+from bin.core.logger import log_info, log_error, log_debug, log_warning, log_success, is_debug_enabled
 from bin.core.theme_manager import get_color, get_node_color_pair
 
 # Import node system
 from nodes import create_node as create_logic_node, get_node_class, REGISTERED_NODES
 
+# Compiler IR pipeline (canvas -> IR -> code); legacy codegen is used when unavailable
+try:
+    from compiler.lowering.canvas_to_ir import CanvasToIR
+    from compiler.semantic.validator import SemanticValidator
+    from compiler.codegen.ir_to_code import IRToCode
+    from compiler.semantic.diagnostics import DiagnosticLevel, make_error
+    _IR_PIPELINE_AVAILABLE = True
+    # Log function per diagnostic level; anything else goes to debug
+    _DIAG_LOG = {
+        DiagnosticLevel.ERROR: log_error,
+        DiagnosticLevel.WARNING: log_warning,
+    }
+except ImportError as _ir_import_error:
+    log_warning(f"IR pipeline unavailable, using legacy codegen: {_ir_import_error}")
+    _IR_PIPELINE_AVAILABLE = False
+    _DIAG_LOG = {}
+
+# Node categories used by code generation, resolved once from the display name
+# at node creation and stored in item data slot 14
+CAT_LOGIC = 0
+CAT_CONDITION = 1
+CAT_ACTION = 2
+CAT_SENSOR = 3
+CAT_OTHER = 4
+
+
+# Fixed fragments of the legacy generated module
+_LEGACY_CODE_HEADER = "\n".join([
+    "#!/usr/bin/env python3",
+    "# -*- coding: utf-8 -*-",
+    '"""',
+    "Auto-generated workflow code",
+    "Generated by UnitPort - Celebrimbor",
+    '"""',
+    "",
+])
+_LEGACY_WORKFLOW_DEF = "\n".join([
+    "def execute_workflow(robot=None):",
+    "    '''Execute the visual workflow'''",
+    "",
+])
+_LEGACY_EMPTY_WORKFLOW = "\n".join([
+    "def execute_workflow(robot=None):",
+    "    '''Execute the visual workflow'''",
+    "    pass  # No nodes in workflow",
+    "",
+])
+_LEGACY_CODE_FOOTER = "\n".join([
+    "",
+    "if __name__ == '__main__':",
+    "    # Initialize robot (simulation or real)",
+    "    # from models import get_robot_model",
+    "    # robot = get_robot_model('go2')",
+    "    robot = None  # Replace with actual robot instance",
+    "    execute_workflow(robot)",
+])
+
+# Widget-backed fields written by serialize_workflow:
+# (entry key, node item attribute, widget getter, default for empty text)
+_SERIALIZED_WIDGET_FIELDS = (
+    ("ui_selection", "_combo", "currentText", None),
+    ("condition_expr", "_condition_input", "text", None),
+    ("loop_type", "_loop_type_combo", "currentText", None),
+    ("for_start", "_for_start_input", "text", "0"),
+    ("for_end", "_for_end_input", "text", "10"),
+    ("for_step", "_for_step_input", "text", "1"),
+    ("left_value", "_left_input", "text", None),
+    ("right_value", "_right_input", "text", None),
+    ("duration", "_duration_input", "text", None),
+)
+
+
+def _node_category(name: str) -> int:
+    """Classify a node display name into a code generation category"""
+    if "Logic Control" in name or "逻辑控制" in name:
+        return CAT_LOGIC
+    if "Condition" in name or "条件判断" in name:
+        return CAT_CONDITION
+    if "Action Execution" in name:
+        return CAT_ACTION
+    if "Sensor Input" in name:
+        return CAT_SENSOR
+    return CAT_OTHER
+
 
 class ConnectionItem(QGraphicsPathItem):
     """Connection Line Item - Supports auto-update and endpoint editing"""
@@ -198,18 +284,14 @@ class PortInputRow(QWidget):
         return proxy.pos().y() + geo.y() + geo.height() / 2
 
 
-def _block_recursive(widget, block: bool):
-    """Recursively block/unblock signals on a widget and all its children."""
-    if widget is None:
-        return
-    widget.blockSignals(block)
-    for child in widget.findChildren(QWidget):
-        child.blockSignals(block)
-
-
 class GraphScene(QGraphicsScene):
     """Graph Editor Scene"""
 
+    # Delay before a requested code regeneration runs (ms)
+    REGEN_DEBOUNCE_MS = 80
+    # Number of (code, diagnostics) results kept by the IR pipeline cache
+    IR_CACHE_SIZE = 32
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -254,6 +336,24 @@ class GraphScene(QGraphicsScene):
         # Store logic node instances (node_id -> BaseNode instance)
         self._logic_nodes: Dict[int, Any] = {}
 
+        # Re-entrancy guards for workflow loading and code regeneration
+        self._loading_workflow = False
+        self._regenerating = False
+
+        # Connection graph cache, invalidated whenever nodes, ports or
+        # connections change (parameter edits keep the cached graph)
+        self._topology_version = 0
+        self._graph_cache: Optional[Dict[str, Any]] = None
+        self._graph_cache_version = -1
+
+        # Compiler pipeline stages (stateless between runs, reused per regeneration)
+        if _IR_PIPELINE_AVAILABLE:
+            self._ir_converter = CanvasToIR()
+            self._ir_validator = SemanticValidator()
+            self._ir_generator = IRToCode()
+        # LRU of pipeline results keyed by a fingerprint of the exported graph
+        self._ir_cache = OrderedDict()
+
         # References
         self._code_editor = None
         self._simulation_thread = None
@@ -264,6 +364,11 @@ class GraphScene(QGraphicsScene):
         self._update_timer.timeout.connect(self._update_all_connections)
         self._update_timer.start(16)  # 60fps
 
+        # Timer - coalesces bursts of edits into a single code regeneration
+        self._regen_timer = QTimer(self)
+        self._regen_timer.setSingleShot(True)
+        self._regen_timer.timeout.connect(self._regenerate_code_now)
+
         log_debug("GraphScene initialized")
 
     def set_code_editor(self, editor):
@@ -275,6 +380,10 @@ class GraphScene(QGraphicsScene):
         self._robot_type = robot_type
         log_info(f"Robot type set to: {robot_type}")
 
+    def _mark_topology_changed(self):
+        """Invalidate the cached connection graph"""
+        self._topology_version += 1
+
     def _apply_theme(self):
         """Apply theme colors and widget styles"""
         self.color_bg = QColor(get_color("graph_bg", get_color("bg", "#1e1e1e")))
@@ -520,6 +629,9 @@ class GraphScene(QGraphicsScene):
             except Exception as e:
                 log_debug(f"Error deleting item: {e}")
 
+        if deleted_nodes or deleted_connections:
+            self._mark_topology_changed()
+
         if deleted_nodes:
             log_success(f"{len(deleted_nodes)} node(s) deleted")
         if deleted_connections:
@@ -555,6 +667,7 @@ class GraphScene(QGraphicsScene):
         try:
             if not isinstance(connection, ConnectionItem):
                 return
+            self._mark_topology_changed()
 
             # Remove from output port
             if connection.out_port and isValid(connection.out_port):
@@ -581,6 +694,7 @@ class GraphScene(QGraphicsScene):
         self._reconnecting = True
         self._reconnect_connection = connection
         self._reconnect_end = end_type
+        self._mark_topology_changed()
 
         # Determine start port and save original port for potential cancel
         if end_type == "start":
@@ -660,6 +774,8 @@ class GraphScene(QGraphicsScene):
                 self._reconnect_connection.out_port
             )
 
+        self._mark_topology_changed()
+
         # Clean up temporary state (but don't restore original port since we succeeded)
         conn = self._reconnect_connection
         self._reconnect_connection = None
@@ -685,6 +801,7 @@ class GraphScene(QGraphicsScene):
                 self._reconnect_connection.in_port = self._reconnect_original_port
             # Update the connection path
             self._reconnect_connection.update_path()
+            self._mark_topology_changed()
 
         self._reconnect_connection = None
         self._reconnect_original_port = None
@@ -767,6 +884,7 @@ class GraphScene(QGraphicsScene):
         """Create connection - using ConnectionItem"""
         conn = ConnectionItem(out_port, in_port)
         self.addItem(conn)
+        self._mark_topology_changed()
 
         # Attach to ports
         self._attach_connection_safe(out_port, conn)
@@ -775,6 +893,24 @@ class GraphScene(QGraphicsScene):
         log_debug(f"Connection created: {out_port.data(3)} -> {in_port.data(3)}")
         self._apply_connection_to_input(in_port, out_port)
 
+    def _valid_partition(self):
+        """
+        Split valid scene items into node items and connection items.
+
+        Returns:
+            (nodes, connections) lists, each item validated once
+        """
+        nodes = []
+        connections = []
+        for item in self.items():
+            if not isValid(item):
+                continue
+            if item.data(10) == "node":
+                nodes.append(item)
+            elif isinstance(item, ConnectionItem):
+                connections.append(item)
+        return nodes, connections
+
     def _update_all_connections(self):
         """Update all connection paths"""
         for item in self.items():
@@ -891,6 +1027,8 @@ class GraphScene(QGraphicsScene):
 
         # Create port function
         port_r = 6
+        rect._port_index = {}  # (io, slot) -> port item
+        rect._signal_widgets = []  # input widgets whose signals are muted during load
 
         def _mk_port(x, y, io, slot, radius=port_r):
             p = QGraphicsEllipseItem(-radius, -radius, radius * 2, radius * 2, rect)
@@ -906,6 +1044,7 @@ class GraphScene(QGraphicsScene):
             p.setZValue(3)
             p.setAcceptedMouseButtons(Qt.LeftButton)
             p.setAcceptHoverEvents(True)
+            rect._port_index[(io, slot)] = p
             return p
 
         # Create different UI and ports based on node type
@@ -1089,12 +1228,16 @@ class GraphScene(QGraphicsScene):
                         self.removeItem(conn)
 
             def _reindex_elifs():
+                for key in [k for k in rect._port_index if k[1].startswith(("elif_", "out_elif_"))]:
+                    del rect._port_index[key]
                 for i, inp in enumerate(rect._elif_inputs):
                     inp.setPlaceholderText(f"elif {i}")
                 for i, port in enumerate(rect._elif_input_ports):
                     port.setData(3, f"elif_{i}")
+                    rect._port_index[("in", f"elif_{i}")] = port
                 for i, port in enumerate(rect._elif_output_ports):
                     port.setData(3, f"out_elif_{i}")
+                    rect._port_index[("out", f"out_elif_{i}")] = port
 
             def _add_elif():
                 idx = len(rect._elif_output_ports)
@@ -1102,6 +1245,7 @@ class GraphScene(QGraphicsScene):
                 outp = _mk_port(w, h * 0.60, "out", f"out_elif_{idx}", radius=6)
                 rect._elif_input_ports.append(inp)
                 rect._elif_output_ports.append(outp)
+                self._mark_topology_changed()
 
                 elif_input = QLineEdit()
                 elif_input.setPlaceholderText(f"elif {idx}")
@@ -1142,6 +1286,7 @@ class GraphScene(QGraphicsScene):
                 row_layout.addWidget(_make_tag("Elif"))
 
                 rect._elif_inputs.append(elif_input)
+                rect._signal_widgets.append(elif_input)
                 rect._elif_rows.append(row_widget)
                 rect._elif_remove_btns.append(remove_btn)
 
@@ -1151,6 +1296,7 @@ class GraphScene(QGraphicsScene):
                         return
                     row_widget.setParent(None)
                     row_widget.deleteLater()
+                    rect._signal_widgets.remove(rect._elif_inputs[idx_local])
                     for port in (rect._elif_input_ports[idx_local], rect._elif_output_ports[idx_local]):
                         _remove_port_connections(port)
                         if port.scene() is not None:
@@ -1161,6 +1307,7 @@ class GraphScene(QGraphicsScene):
                     rect._elif_input_ports.pop(idx_local)
                     rect._elif_output_ports.pop(idx_local)
                     _reindex_elifs()
+                    self._mark_topology_changed()
                     QTimer.singleShot(0, _sync_layout)
                     self.regenerate_code()
 
@@ -1329,6 +1476,10 @@ class GraphScene(QGraphicsScene):
             rect._for_start_input = for_start_input
             rect._for_end_input = for_end_input
             rect._for_step_input = for_step_input
+            rect._signal_widgets.extend([
+                combo, condition_input, loop_type_combo,
+                for_start_input, for_end_input, for_step_input,
+            ])
 
             _on_mode_change()
             condition_input.textChanged.connect(lambda _t: self._update_node_params(rect))
@@ -1429,6 +1580,7 @@ class GraphScene(QGraphicsScene):
             rect._left_input = left_input
             rect._right_input = right_input
             rect._combo = combo
+            rect._signal_widgets.extend([combo, left_input, right_input])
             left_input.textChanged.connect(lambda _t: self._update_node_params(rect))
             right_input.textChanged.connect(lambda _t: self._update_node_params(rect))
             combo.currentTextChanged.connect(lambda _t: self._update_node_params(rect))
@@ -1498,6 +1650,7 @@ class GraphScene(QGraphicsScene):
             QTimer.singleShot(0, _sync_layout)
 
             rect._duration_input = duration_input
+            rect._signal_widgets.append(duration_input)
 
             def _on_duration_change():
                 self._update_node_params(rect)
@@ -1516,6 +1669,11 @@ class GraphScene(QGraphicsScene):
             elif "Compute" in name:
                 features = features or ["Add", "Subtract", "Multiply", "Divide"]
 
+            if "Action Execution" in name:
+                # Resolve robot action names once so codegen only hits the dict
+                for action in features:
+                    self._action_slug(action)
+
             combo = QComboBox()
             combo.addItems(features)
             combo.setMinimumWidth(int(w * 0.85))
@@ -1529,6 +1687,7 @@ class GraphScene(QGraphicsScene):
             proxy.setWidget(combo)
             proxy.setPos(8, 38)
             proxy.setZValue(2)
+            rect._signal_widgets.append(combo)
 
         # Node metadata
         node_id = self._node_seq
@@ -1536,6 +1695,8 @@ class GraphScene(QGraphicsScene):
         rect.setData(10, "node")
         rect.setData(11, name)
         rect.setData(12, node_id)
+        rect.setData(14, _node_category(name))
+        self._mark_topology_changed()
 
         # Create corresponding logic node instance
         logic_node = self._create_logic_node(name, node_id, rect)
@@ -1612,6 +1773,14 @@ class GraphScene(QGraphicsScene):
         self._sync_node_parameters(rect_item)
         self.regenerate_code()
 
+    def _action_slug(self, action: str) -> str:
+        """Map a UI action name to its robot action, caching derived names"""
+        slug = self._action_mapping.get(action)
+        if slug is None:
+            slug = action.lower().replace(" ", "_")
+            self._action_mapping[action] = slug
+        return slug
+
     def _sync_node_parameters(self, rect_item):
         """Sync UI values to logic node parameters"""
         node_id = rect_item.data(12)
@@ -1626,7 +1795,7 @@ class GraphScene(QGraphicsScene):
         if "Action Execution" in name and combo:
             action = combo.currentText()
             # Map UI action to robot action
-            robot_action = self._action_mapping.get(action, action.lower().replace(" ", "_"))
+            robot_action = self._action_slug(action)
             logic_node.set_parameter('action', robot_action)
 
         elif "Sensor Input" in name and combo:
@@ -1953,50 +2122,44 @@ class GraphScene(QGraphicsScene):
         Returns:
             List of node items in execution order
         """
-        # Create snapshot to avoid modification during iteration
-        items_snapshot = list(self.items())
+        node_items, connection_items = self._valid_partition()
 
         # Collect all connections and connected nodes
         connections = []
         connected_node_ids = set()
         node_map = {}  # id -> node item
 
-        for item in items_snapshot:
-            # Skip invalid items
-            if not isValid(item):
-                continue
-
-            if isinstance(item, ConnectionItem):
-                # Skip incomplete connections
-                if not item.out_port or not item.in_port:
-                    continue
-                if not isValid(item.out_port) or not isValid(item.in_port):
-                    continue
+        for item in node_items:
+            node_id = item.data(12)
+            if node_id is not None:
+                node_map[node_id] = item
 
-                out_node = item.out_port.parentItem()
-                in_node = item.in_port.parentItem()
+        for item in connection_items:
+            # Skip incomplete connections
+            if not item.out_port or not item.in_port:
+                continue
+            if not isValid(item.out_port) or not isValid(item.in_port):
+                continue
 
-                if not out_node or not in_node:
-                    continue
-                if out_node.data(10) != "node" or in_node.data(10) != "node":
-                    continue
+            out_node = item.out_port.parentItem()
+            in_node = item.in_port.parentItem()
 
-                out_id = out_node.data(12)
-                in_id = in_node.data(12)
+            if not out_node or not in_node:
+                continue
+            if out_node.data(10) != "node" or in_node.data(10) != "node":
+                continue
 
-                if out_id is None or in_id is None:
-                    continue
+            out_id = out_node.data(12)
+            in_id = in_node.data(12)
 
-                connections.append((out_id, in_id))
-                connected_node_ids.add(out_id)
-                connected_node_ids.add(in_id)
-                node_map[out_id] = out_node
-                node_map[in_id] = in_node
+            if out_id is None or in_id is None:
+                continue
 
-            elif item.data(10) == "node":
-                node_id = item.data(12)
-                if node_id is not None:
-                    node_map[node_id] = item
+            connections.append((out_id, in_id))
+            connected_node_ids.add(out_id)
+            connected_node_ids.add(in_id)
+            node_map[out_id] = out_node
+            node_map[in_id] = in_node
 
         # If no connections, return empty (no connected workflow)
         if not connected_node_ids:
@@ -2034,6 +2197,16 @@ class GraphScene(QGraphicsScene):
         return result
 
     def _build_connection_graph(self) -> Dict[str, Any]:
+        """Get the connection graph, rebuilding it only after topology changes"""
+        if self._graph_cache is not None and self._graph_cache_version == self._topology_version:
+            return self._graph_cache
+
+        graph = self._scan_connection_graph()
+        self._graph_cache = graph
+        self._graph_cache_version = self._topology_version
+        return graph
+
+    def _scan_connection_graph(self) -> Dict[str, Any]:
         """Build a graph of all connections for code generation"""
         graph = {
             'nodes': {},        # node_id -> node_item
@@ -2041,59 +2214,52 @@ class GraphScene(QGraphicsScene):
             'incoming': {},     # node_id -> {port_name -> [(source_node_id, source_port)]}
         }
 
-        # Create snapshot to avoid modification during iteration
-        items_snapshot = list(self.items())
+        node_items, connection_items = self._valid_partition()
 
         # Collect all nodes
-        for item in items_snapshot:
-            if not isValid(item):
-                continue
-            if item.data(10) == "node":
-                node_id = item.data(12)
-                if node_id is not None:
-                    graph['nodes'][node_id] = item
-                    graph['outgoing'][node_id] = {}
-                    graph['incoming'][node_id] = {}
+        for item in node_items:
+            node_id = item.data(12)
+            if node_id is not None:
+                graph['nodes'][node_id] = item
+                graph['outgoing'][node_id] = {}
+                graph['incoming'][node_id] = {}
 
         # Collect all connections
-        for item in items_snapshot:
-            if not isValid(item):
+        for item in connection_items:
+            # Skip incomplete connections
+            if not item.out_port or not item.in_port:
+                continue
+            if not isValid(item.out_port) or not isValid(item.in_port):
                 continue
-            if isinstance(item, ConnectionItem):
-                # Skip incomplete connections
-                if not item.out_port or not item.in_port:
-                    continue
-                if not isValid(item.out_port) or not isValid(item.in_port):
-                    continue
 
-                out_node = item.out_port.parentItem()
-                in_node = item.in_port.parentItem()
+            out_node = item.out_port.parentItem()
+            in_node = item.in_port.parentItem()
 
-                if not out_node or not in_node:
-                    continue
-                if out_node.data(10) != "node" or in_node.data(10) != "node":
-                    continue
+            if not out_node or not in_node:
+                continue
+            if out_node.data(10) != "node" or in_node.data(10) != "node":
+                continue
 
-                out_id = out_node.data(12)
-                in_id = in_node.data(12)
+            out_id = out_node.data(12)
+            in_id = in_node.data(12)
 
-                if out_id is None or in_id is None:
-                    continue
-                if out_id not in graph['nodes'] or in_id not in graph['nodes']:
-                    continue
+            if out_id is None or in_id is None:
+                continue
+            if out_id not in graph['nodes'] or in_id not in graph['nodes']:
+                continue
 
-                out_port = item.out_port.data(3)
-                in_port = item.in_port.data(3)
+            out_port = item.out_port.data(3)
+            in_port = item.in_port.data(3)
 
-                # Add to outgoing
-                if out_port not in graph['outgoing'][out_id]:
-                    graph['outgoing'][out_id][out_port] = []
-                graph['outgoing'][out_id][out_port].append((in_id, in_port))
+            # Add to outgoing
+            if out_port not in graph['outgoing'][out_id]:
+                graph['outgoing'][out_id][out_port] = []
+            graph['outgoing'][out_id][out_port].append((in_id, in_port))
 
-                # Add to incoming
-                if in_port not in graph['incoming'][in_id]:
-                    graph['incoming'][in_id][in_port] = []
-                graph['incoming'][in_id][in_port].append((out_id, out_port))
+            # Add to incoming
+            if in_port not in graph['incoming'][in_id]:
+                graph['incoming'][in_id][in_port] = []
+            graph['incoming'][in_id][in_port].append((out_id, out_port))
 
         return graph
 
@@ -2131,9 +2297,8 @@ class GraphScene(QGraphicsScene):
             source_id, source_port = condition_sources[0]
             source_item = graph['nodes'].get(source_id)
             if source_item and isValid(source_item):
-                source_name = source_item.data(11)
                 # If connected to a Condition node, use its output variable
-                if source_name and "Condition" in source_name:
+                if source_item.data(14) == CAT_CONDITION:
                     logic_node = self._logic_nodes.get(source_id)
                     if logic_node:
                         output_name = logic_node.get_parameter('output_name', '') or 'result'
@@ -2151,29 +2316,29 @@ class GraphScene(QGraphicsScene):
         return 'condition'
 
     def _generate_node_code(self, node_id: int, graph: Dict[str, Any],
-                            indent: int, generated: set) -> List[str]:
-        """Recursively generate code for a node and its downstream nodes"""
+                            indent: int, generated: set, code_lines: List[str]):
+        """Recursively generate code for a node and its downstream nodes into code_lines"""
         if node_id in generated:
-            return []
+            return
         if node_id is None:
-            return []
+            return
 
         generated.add(node_id)
-        code_lines = []
         indent_str = "    " * indent
 
         item = graph['nodes'].get(node_id)
         if not item or not isValid(item):
-            return []
+            return
 
         node_name = item.data(11)
         if not node_name:
-            return []
+            return
+        category = item.data(14)
         logic_node = self._logic_nodes.get(node_id)
         outgoing = graph['outgoing'].get(node_id, {})
 
         # Handle Logic Control nodes (if/while/for)
-        if "Logic Control" in node_name:
+        if category == CAT_LOGIC:
             combo = getattr(item, '_combo', None)
             selection = combo.currentText().lower() if combo else "if"
 
@@ -2186,7 +2351,7 @@ class GraphScene(QGraphicsScene):
                 true_targets = outgoing.get('out_if', [])
                 if true_targets:
                     for target_id, _ in true_targets:
-                        code_lines.extend(self._generate_node_code(target_id, graph, indent + 1, generated))
+                        self._generate_node_code(target_id, graph, indent + 1, generated, code_lines)
                 else:
                     code_lines.append(f"{indent_str}    pass")
 
@@ -2200,7 +2365,7 @@ class GraphScene(QGraphicsScene):
                     elif_targets = outgoing.get(elif_port, [])
                     if elif_targets:
                         for target_id, _ in elif_targets:
-                            code_lines.extend(self._generate_node_code(target_id, graph, indent + 1, generated))
+                            self._generate_node_code(target_id, graph, indent + 1, generated, code_lines)
                     else:
                         code_lines.append(f"{indent_str}    pass")
 
@@ -2209,7 +2374,7 @@ class GraphScene(QGraphicsScene):
                 false_targets = outgoing.get('out_else', [])
                 if false_targets:
                     for target_id, _ in false_targets:
-                        code_lines.extend(self._generate_node_code(target_id, graph, indent + 1, generated))
+                        self._generate_node_code(target_id, graph, indent + 1, generated, code_lines)
                 else:
                     code_lines.append(f"{indent_str}    pass")
 
@@ -2234,17 +2399,17 @@ class GraphScene(QGraphicsScene):
                 body_targets = outgoing.get('loop_body', [])
                 if body_targets:
                     for target_id, _ in body_targets:
-                        code_lines.extend(self._generate_node_code(target_id, graph, indent + 1, generated))
+                        self._generate_node_code(target_id, graph, indent + 1, generated, code_lines)
                 else:
                     code_lines.append(f"{indent_str}    pass")
 
                 # Continue with loop_end (code after loop)
                 end_targets = outgoing.get('loop_end', [])
                 for target_id, _ in end_targets:
-                    code_lines.extend(self._generate_node_code(target_id, graph, indent, generated))
+                    self._generate_node_code(target_id, graph, indent, generated, code_lines)
 
         # Handle Condition nodes
-        elif "Condition" in node_name:
+        elif category == CAT_CONDITION:
             if logic_node:
                 # Sync parameters
                 self._sync_node_parameters(item)
@@ -2265,29 +2430,39 @@ class GraphScene(QGraphicsScene):
             else:
                 # Fallback
                 combo = getattr(item, '_combo', None)
-                if combo and "Action Execution" in node_name:
+                if combo and category == CAT_ACTION:
                     action = combo.currentText()
-                    robot_action = self._action_mapping.get(action, action.lower().replace(" ", "_"))
+                    robot_action = self._action_slug(action)
                     code_lines.append(f"{indent_str}# Action: {action}")
                     code_lines.append(f"{indent_str}robot.run_action('{robot_action}')")
-                elif combo and "Sensor Input" in node_name:
+                elif combo and category == CAT_SENSOR:
                     code_lines.append(f"{indent_str}# Sensor read")
                     code_lines.append(f"{indent_str}sensor_data = robot.get_sensor_data()")
 
             # Continue with flow_out
             flow_targets = outgoing.get('flow_out', [])
             for target_id, _ in flow_targets:
-                code_lines.extend(self._generate_node_code(target_id, graph, indent, generated))
-
-        return code_lines
+                self._generate_node_code(target_id, graph, indent, generated, code_lines)
 
     def regenerate_code(self):
+        """Schedule code regeneration; repeated requests are coalesced"""
+        if self._loading_workflow:
+            return
+        self._regen_timer.start(self.REGEN_DEBOUNCE_MS)
+
+    def flush_code(self):
+        """Run a scheduled code regeneration now so the code editor is up to date"""
+        if self._regen_timer.isActive():
+            self._regenerate_code_now()
+
+    def _regenerate_code_now(self):
         """Regenerate code with proper control flow nesting"""
+        self._regen_timer.stop()
         # Suppress during batch load
-        if getattr(self, '_loading_workflow', False):
+        if self._loading_workflow:
             return
         # Prevent recursive calls
-        if getattr(self, '_regenerating', False):
+        if self._regenerating:
             return
         if not self._code_editor:
             return
@@ -2329,90 +2504,78 @@ class GraphScene(QGraphicsScene):
         Returns:
             Dict with nodes and connections suitable for CanvasToIR.
         """
-        items_snapshot = list(self.items())
-        for item in items_snapshot:
-            if not isValid(item):
-                continue
-            if item.data(10) == "node":
-                self._sync_node_parameters(item)
-
-        return self.serialize_workflow()
+        return self.serialize_workflow(sync=True)
 
     def _show_diagnostics(self, diags):
         """Show diagnostics from the compiler pipeline."""
+        log_for = _DIAG_LOG.get
         for diag in diags:
-            msg = str(diag)
-            if diag.level.value == "error":
-                log_error(msg)
-            elif diag.level.value == "warn":
-                log_warning(msg)
-            else:
-                log_debug(msg)
+            logger = log_for(diag.level, log_debug)
+            if logger is log_debug and not is_debug_enabled():
+                continue
+            logger(str(diag))
 
     def _regenerate_code_impl(self):
         """Internal implementation of code regeneration using the compiler IR pipeline."""
-        try:
-            from compiler.lowering.canvas_to_ir import CanvasToIR
-            from compiler.codegen.ir_to_code import IRToCode
-            from compiler.semantic.validator import SemanticValidator
+        if not _IR_PIPELINE_AVAILABLE:
+            self._regenerate_code_impl_legacy()
+            return
+
+        graph_data = self.export_graph_data()
+        key = self._graph_fingerprint(graph_data)
+        cached = self._ir_cache.get(key)
+        if cached is not None:
+            self._ir_cache.move_to_end(key)
+            code, all_diags = cached
+            self._show_diagnostics(all_diags)
+            self._code_editor.set_code(code)
+            return
 
-            graph_data = self.export_graph_data()
-            converter = CanvasToIR()
-            ir, convert_diags = converter.convert(graph_data, self._robot_type)
+        try:
+            ir, convert_diags = self._ir_converter.convert(graph_data, self._robot_type)
+        except (KeyError, TypeError, ValueError) as e:
+            # Malformed canvas data: report it and keep the editor populated
+            self._show_diagnostics([make_error(
+                "E2009", f"Canvas graph could not be lowered to IR: {e}")])
+            self._regenerate_code_impl_legacy()
+            return
 
-            validator = SemanticValidator()
-            validate_diags = validator.validate(ir)
+        validate_diags = self._ir_validator.validate(ir)
+        code, gen_diags, source_map = self._ir_generator.generate(ir)
 
-            generator = IRToCode()
-            code, gen_diags, source_map = generator.generate(ir)
+        all_diags = convert_diags + validate_diags + gen_diags
+        self._ir_cache[key] = (code, all_diags)
+        if len(self._ir_cache) > self.IR_CACHE_SIZE:
+            self._ir_cache.popitem(last=False)
 
-            all_diags = convert_diags + validate_diags + gen_diags
-            self._show_diagnostics(all_diags)
+        self._show_diagnostics(all_diags)
 
-            self._code_editor.set_code(code)
-            return
-        except Exception as e:
-            log_warning(f"IR pipeline error, falling back to legacy codegen: {e}")
+        self._code_editor.set_code(code)
 
-        # Legacy fallback
-        self._regenerate_code_impl_legacy()
+    def _graph_fingerprint(self, graph_data: Dict[str, Any]) -> bytes:
+        """Hash exported graph data (plus robot type) into an IR cache key."""
+        payload = json.dumps([self._robot_type, graph_data], sort_keys=True,
+                             separators=(',', ':'), default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
 
     def _regenerate_code_impl_legacy(self):
         """Legacy code regeneration (pre-IR pipeline)."""
-        # Create snapshot and sync all node parameters before generating code
-        items_snapshot = list(self.items())
-        for item in items_snapshot:
-            if not isValid(item):
-                continue
-            if item.data(10) == "node":
-                self._sync_node_parameters(item)
+        # Sync all node parameters before generating code
+        node_items, _ = self._valid_partition()
+        for item in node_items:
+            self._sync_node_parameters(item)
 
-        code_lines = [
-            "#!/usr/bin/env python3",
-            "# -*- coding: utf-8 -*-",
-            '"""',
-            "Auto-generated workflow code",
-            "Generated by UnitPort - Celebrimbor",
-            '"""',
-            "",
-        ]
+        # Each top-level fragment is joined once; fragments are joined at the end
+        parts = [_LEGACY_CODE_HEADER]
 
         # Build connection graph
         graph = self._build_connection_graph()
 
         if not graph['nodes']:
-            code_lines.extend([
-                "def execute_workflow(robot=None):",
-                "    '''Execute the visual workflow'''",
-                "    pass  # No nodes in workflow",
-                "",
-            ])
+            parts.append(_LEGACY_EMPTY_WORKFLOW)
         else:
-            code_lines.extend([
-                "def execute_workflow(robot=None):",
-                "    '''Execute the visual workflow'''",
-                "",
-            ])
+            parts.append(_LEGACY_WORKFLOW_DEF)
+            body_start = len(parts)
 
             # Find entry points and generate code
             entry_nodes = self._find_entry_nodes(graph)
@@ -2420,116 +2583,82 @@ class GraphScene(QGraphicsScene):
 
             # First generate Condition nodes that provide data (not in control flow)
             for node_id, item in graph['nodes'].items():
-                node_name = item.data(11)
-                if "Condition" in node_name:
+                if item.data(14) == CAT_CONDITION:
                     # Check if this feeds into a Logic Control node
                     outgoing = graph['outgoing'].get(node_id, {})
                     result_targets = outgoing.get('result', [])
                     for target_id, target_port in result_targets:
                         if target_port == 'condition':
                             # This is a data provider, generate it first
-                            code_lines.extend(self._generate_node_code(node_id, graph, 1, generated))
-                            code_lines.append("")
+                            buf = []
+                            self._generate_node_code(node_id, graph, 1, generated, buf)
+                            buf.append("")
+                            parts.append("\n".join(buf))
                             break
 
             # Generate code starting from entry nodes
             for entry_id in entry_nodes:
                 if entry_id not in generated:
-                    node_code = self._generate_node_code(entry_id, graph, 1, generated)
-                    code_lines.extend(node_code)
-                    if node_code:
-                        code_lines.append("")
+                    buf = []
+                    self._generate_node_code(entry_id, graph, 1, generated, buf)
+                    if buf:
+                        buf.append("")
+                        parts.append("\n".join(buf))
 
             # Check if any code was generated
-            if len(code_lines) <= 8:  # Only header
-                code_lines.append("    pass  # No connected workflow")
-
-        code_lines.extend([
-            "",
-            "if __name__ == '__main__':",
-            "    # Initialize robot (simulation or real)",
-            "    # from models import get_robot_model",
-            "    # robot = get_robot_model('go2')",
-            "    robot = None  # Replace with actual robot instance",
-            "    execute_workflow(robot)",
-        ])
+            if len(parts) == body_start:
+                parts.append("    pass  # No connected workflow")
+
+        parts.append(_LEGACY_CODE_FOOTER)
 
         # Use set_code method
-        self._code_editor.set_code("\n".join(code_lines))
+        self._code_editor.set_code("\n".join(parts))
 
-    def serialize_workflow(self) -> Dict[str, Any]:
+    def serialize_workflow(self, sync: bool = False) -> Dict[str, Any]:
         """
         Serialize the current workflow state to a JSON-compatible dict.
         Used for saving, regression baselines, and round-trip testing.
 
+        Args:
+            sync: Sync each node's widget values into its logic node while serializing
+
         Returns:
             Dict with nodes, connections, and metadata.
         """
-        items_snapshot = list(self.items())
+        node_items, connection_items = self._valid_partition()
 
         nodes = []
-        for item in items_snapshot:
-            if not isValid(item):
-                continue
-            if item.data(10) != "node":
-                continue
+        append_node = nodes.append
+        logic_nodes_get = self._logic_nodes.get
+        for item in node_items:
+            if sync:
+                self._sync_node_parameters(item)
 
             node_id = item.data(12)
             if node_id is None:
                 continue
 
             name = item.data(11) or ""
-            logic_node = self._logic_nodes.get(node_id)
+            logic_node = logic_nodes_get(node_id)
 
             # Position
             pos = item.pos()
+            rect = item.rect()
             node_entry = {
                 "id": node_id,
                 "display_name": name,
                 "position": {"x": round(pos.x(), 1), "y": round(pos.y(), 1)},
-                "width": round(item.rect().width(), 1),
-                "height": round(item.rect().height(), 1),
+                "width": round(rect.width(), 1),
+                "height": round(rect.height(), 1),
                 "node_type": logic_node.node_type if logic_node else "unknown",
             }
 
-            # Combo selection
-            combo = getattr(item, '_combo', None)
-            if combo:
-                node_entry["ui_selection"] = combo.currentText()
-
-            # Condition input
-            cond_input = getattr(item, '_condition_input', None)
-            if cond_input:
-                node_entry["condition_expr"] = cond_input.text()
-
-            # Loop type
-            loop_type_combo = getattr(item, '_loop_type_combo', None)
-            if loop_type_combo:
-                node_entry["loop_type"] = loop_type_combo.currentText()
-
-            # For loop params
-            for_start = getattr(item, '_for_start_input', None)
-            for_end = getattr(item, '_for_end_input', None)
-            for_step = getattr(item, '_for_step_input', None)
-            if for_start:
-                node_entry["for_start"] = for_start.text() or "0"
-            if for_end:
-                node_entry["for_end"] = for_end.text() or "10"
-            if for_step:
-                node_entry["for_step"] = for_step.text() or "1"
-
-            # Condition node inputs
-            left_input = getattr(item, '_left_input', None)
-            right_input = getattr(item, '_right_input', None)
-            if left_input:
-                node_entry["left_value"] = left_input.text()
-            if right_input:
-                node_entry["right_value"] = right_input.text()
-
-            # Timer duration
-            duration_input = getattr(item, '_duration_input', None)
-            if duration_input:
-                node_entry["duration"] = duration_input.text()
+            # Widget values (combo selections, inputs, loop and timer params)
+            for key, attr, getter, default in _SERIALIZED_WIDGET_FIELDS:
+                widget = getattr(item, attr, None)
+                if widget:
+                    value = getattr(widget, getter)()
+                    node_entry[key] = (value or default) if default else value
 
             # Elif conditions
             elif_inputs = getattr(item, '_elif_inputs', None)
@@ -2537,18 +2666,15 @@ class GraphScene(QGraphicsScene):
                 node_entry["elif_conditions"] = [inp.text() for inp in elif_inputs]
 
             # Features (available combo items)
+            combo = getattr(item, '_combo', None)
             if combo:
                 node_entry["features"] = [combo.itemText(i) for i in range(combo.count())]
 
-            nodes.append(node_entry)
+            append_node(node_entry)
 
         # Connections
         connections = []
-        for item in items_snapshot:
-            if not isValid(item):
-                continue
-            if not isinstance(item, ConnectionItem):
-                continue
+        for item in connection_items:
             if not item.out_port or not item.in_port:
                 continue
             if not isValid(item.out_port) or not isValid(item.in_port):
@@ -2592,9 +2718,10 @@ class GraphScene(QGraphicsScene):
             self._load_workflow_impl(data)
         finally:
             self._loading_workflow = False
+            self._mark_topology_changed()
 
-        # Single regenerate at the end
-        self.regenerate_code()
+        # Single regenerate at the end, bypassing the debounce
+        self._regenerate_code_now()
         log_info(f"Workflow loaded: {len(data.get('nodes', []))} nodes, "
                  f"{len(data.get('connections', []))} connections")
 
@@ -2705,17 +2832,6 @@ class GraphScene(QGraphicsScene):
 
             id_to_item[old_id] = rect
 
-        # Build port lookup: (node_item, port_name) -> port_item
-        def _find_port(node_item, port_name, io_direction):
-            if not node_item or not isValid(node_item):
-                return None
-            for child in node_item.childItems():
-                if (child.data(0) == "port"
-                        and child.data(1) == io_direction
-                        and child.data(3) == port_name):
-                    return child
-            return None
-
         # Create connections
         for conn_data in data.get("connections", []):
             from_id = conn_data.get("from_node")
@@ -2728,8 +2844,8 @@ class GraphScene(QGraphicsScene):
             if not from_item or not to_item:
                 continue
 
-            out_port = _find_port(from_item, from_port_name, "out")
-            in_port = _find_port(to_item, to_port_name, "in")
+            out_port = from_item._port_index.get(("out", from_port_name))
+            in_port = to_item._port_index.get(("in", to_port_name))
             if not out_port or not in_port:
                 continue
 
@@ -2737,22 +2853,15 @@ class GraphScene(QGraphicsScene):
 
     @staticmethod
     def _set_node_widgets_silent(node_item, block: bool):
-        """Block or unblock signals on all QWidget children of a node item."""
-        from PySide6.QtWidgets import QGraphicsProxyWidget
+        """Block or unblock signals on the input widgets of a node item."""
         if not node_item or not isValid(node_item):
             return
-        for child in node_item.childItems():
-            if not isValid(child):
-                continue
-            if isinstance(child, QGraphicsProxyWidget):
-                w = child.widget()
-                if w:
-                    _block_recursive(w, block)
+        for w in node_item._signal_widgets:
+            w.blockSignals(block)
 
     def _center_view_on_content(self):
         """Center the graph view on the content bounding rect."""
-        items = [item for item in self.items()
-                 if isValid(item) and item.data(10) == "node"]
+        items, _ = self._valid_partition()
         if not items:
             return
         # Compute bounding rect of all nodes
@@ -2770,19 +2879,15 @@ class GraphScene(QGraphicsScene):
     def clear_all_nodes(self):
         """Clear all nodes and connections from the scene."""
         # Remove all items
-        items_to_remove = []
-        for item in self.items():
-            if not isValid(item):
-                continue
-            if isinstance(item, ConnectionItem) or item.data(10) == "node":
-                items_to_remove.append(item)
+        node_items, connection_items = self._valid_partition()
 
-        for item in items_to_remove:
+        for item in connection_items + node_items:
             if isValid(item) and item.scene() is not None:
                 self.removeItem(item)
 
         self._logic_nodes.clear()
         self._node_seq = 0
+        self._mark_topology_changed()
         log_info("All nodes cleared")
 
     def get_workflow_data(self) -> Dict[str, Any]:
@@ -2822,38 +2927,34 @@ class GraphScene(QGraphicsScene):
             workflow['nodes'].append(node_data)
             workflow['execution_order'].append(node_id)
 
-        # Create snapshot for connections to avoid modification during iteration
-        items_snapshot = list(self.items())
+        _, connection_items = self._valid_partition()
 
         # Collect connections
-        for item in items_snapshot:
-            if not isValid(item):
+        for item in connection_items:
+            # Skip incomplete connections
+            if not item.out_port or not item.in_port:
+                continue
+            if not isValid(item.out_port) or not isValid(item.in_port):
                 continue
-            if isinstance(item, ConnectionItem):
-                # Skip incomplete connections
-                if not item.out_port or not item.in_port:
-                    continue
-                if not isValid(item.out_port) or not isValid(item.in_port):
-                    continue
 
-                out_node = item.out_port.parentItem()
-                in_node = item.in_port.parentItem()
+            out_node = item.out_port.parentItem()
+            in_node = item.in_port.parentItem()
 
-                if not out_node or not in_node:
-                    continue
+            if not out_node or not in_node:
+                continue
 
-                from_node_id = out_node.data(12)
-                to_node_id = in_node.data(12)
+            from_node_id = out_node.data(12)
+            to_node_id = in_node.data(12)
 
-                if from_node_id is None or to_node_id is None:
-                    continue
+            if from_node_id is None or to_node_id is None:
+                continue
 
-                workflow['connections'].append({
-                    'from_node': from_node_id,
-                    'from_port': item.out_port.data(3),
-                    'to_node': to_node_id,
-                    'to_port': item.in_port.data(3)
-                })
+            workflow['connections'].append({
+                'from_node': from_node_id,
+                'from_port': item.out_port.data(3),
+                'to_node': to_node_id,
+                'to_port': item.in_port.data(3)
+            })
 
         return workflow
 
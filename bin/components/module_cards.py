@@ -7,7 +7,7 @@ Module palette component for the node library.
 import json
 from typing import Dict, Any, Optional
 
-from PySide6.QtCore import Qt, QMimeData, Signal
+from PySide6.QtCore import Qt, QByteArray, QMimeData, Signal
 from PySide6.QtGui import QDrag
 from PySide6.QtWidgets import (
     QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel,
@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from bin.core.logger import log_debug
-from bin.core.localisation import tr
+from bin.core.localisation import tr, get_localisation
 from bin.core.theme_manager import get_color, get_font_size
 from nodes.sys_nodes import (
     ActionExecutionNode,
@@ -28,12 +28,79 @@ from nodes.sys_nodes import (
 )
 from custom_nodes import get_custom_nodes
 
+try:
+    from orjson import dumps as _dumps_payload
+except ImportError:
+    def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+# Item data role holding the pre-encoded drag payload
+_PAYLOAD_BYTES_ROLE = Qt.UserRole + 1
+
+# System node library: (group key, group default label, ((item label, payload), ...))
+_ACTION_FEATURES = ["Lift Right Leg", "Stand", "Sit", "Walk", "Stop"]
+_LOGIC_FEATURES = ["If", "While Loop"]
+
+_NODE_SCHEMA = (
+    ("modules.action_nodes", "Action Nodes", (
+        ("ActionExecutionNode", {
+            "title": "Action Execution",
+            "features": _ACTION_FEATURES,
+            "preset": "Stand"
+        }),
+        ("StopNode", {
+            "title": "Action Execution",
+            "features": _ACTION_FEATURES,
+            "preset": "Stop"
+        }),
+    )),
+    ("modules.logic_nodes", "Logic Nodes", (
+        ("IfNode", {
+            "title": "Logic Control",
+            "features": _LOGIC_FEATURES,
+            "preset": "If"
+        }),
+        ("WhileLoopNode", {
+            "title": "Logic Control",
+            "features": _LOGIC_FEATURES,
+            "preset": "While Loop"
+        }),
+        ("ComparisonNode", {
+            "title": "Condition",
+            "features": ["Equal", "Not Equal", "Greater Than", "Less Than", "Greater Equal", "Less Equal"],
+            "preset": "Equal"
+        }),
+    )),
+    ("modules.sensor_nodes", "Sensor Nodes", (
+        ("SensorInputNode", {
+            "title": "Sensor Input",
+            "features": ["Read Ultrasonic", "Read Infrared", "Read Camera", "Read IMU", "Read Odometry"],
+            "preset": "Read IMU"
+        }),
+    )),
+    ("modules.utility_nodes", "Utility Nodes", (
+        ("MathNode", {
+            "title": "Math",
+            "features": ["Add", "Subtract", "Multiply", "Divide", "Power", "Modulo", "Min", "Max", "Abs", "Sum", "Average"],
+            "preset": "Add"
+        }),
+        ("TimerNode", {
+            "title": "Timer",
+            "features": []
+        }),
+    )),
+)
+
 
 class NodeTree(QTreeWidget):
     """Draggable node tree"""
 
+    # Stylesheets shared across trees, keyed by the theme values they use
+    _qss_cache: Dict[tuple, str] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._applied_qss: Optional[str] = None
         self.setHeaderHidden(True)
         self.setUniformRowHeights(True)
         self.setIndentation(12)
@@ -49,7 +116,19 @@ class NodeTree(QTreeWidget):
         selected_bg = get_color("card_bg", "#1f2937")
         font_size = get_font_size("size_small", 12)
 
-        self.setStyleSheet(
+        key = (text_primary, hover_bg, selected_bg, font_size)
+        qss = self._qss_cache.get(key)
+        if qss is None:
+            qss = self._qss_cache[key] = self._build_qss(*key)
+        # Re-applying an identical stylesheet still forces Qt to re-parse it
+        if qss is not self._applied_qss:
+            self.setStyleSheet(qss)
+            self._applied_qss = qss
+
+    @staticmethod
+    def _build_qss(text_primary: str, hover_bg: str, selected_bg: str, font_size: int) -> str:
+        """Build the tree stylesheet for the given theme values"""
+        return (
             f"""
             QTreeWidget {{
                 background: transparent;
@@ -81,7 +160,7 @@ class NodeTree(QTreeWidget):
 
         drag = QDrag(self)
         mime = QMimeData()
-        mime.setData("application/x-module-card", json.dumps(payload).encode("utf-8"))
+        mime.setData("application/x-module-card", item.data(0, _PAYLOAD_BYTES_ROLE))
         mime.setText(f"Node: {payload.get('title', '')}")
         drag.setMimeData(mime)
         drag.exec(Qt.CopyAction)
@@ -93,11 +172,16 @@ class ModulePalette(QWidget):
 
     node_requested = Signal(dict)
 
+    # Panel stylesheets shared across palettes, keyed by theme values
+    _panel_qss_cache: Dict[tuple, str] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumWidth(200)
         self.setMaximumWidth(280)
         self._init_ui()
+        # Labels only change with the language, not with the theme
+        get_localisation().language_changed.connect(self._on_language_changed)
 
     def _init_ui(self):
         """Initialize UI"""
@@ -131,6 +215,7 @@ class ModulePalette(QWidget):
         v.addWidget(self.tree, 1)
 
         self.status_label = QLabel(tr("modules.status_ready", "Graph editor ready"))
+        self.status_label.setObjectName("panelStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
         v.addWidget(self.status_label)
 
@@ -139,17 +224,28 @@ class ModulePalette(QWidget):
 
     def _apply_style(self):
         """Apply theme styles"""
-        panel_bg = get_color("panel_bg", get_color("card_bg", "#2a2c33"))
-        panel_border = get_color("panel_border", get_color("border", "#3f4147"))
-        title_color = get_color("text_primary", "#e5e7eb")
-        subtitle_color = get_color("text_secondary", "#9ca3af")
-        status_text = get_color("text_secondary", "#9ca3af")
-        status_bg = get_color("hover_bg", "rgba(255, 255, 255, 0.03)")
-        status_border = get_color("border", "rgba(255, 255, 255, 0.1)")
-        title_size = get_font_size("size_large", 16)
-        subtitle_size = get_font_size("size_small", 12)
-
-        self.panel.setStyleSheet(
+        # One stylesheet on the panel styles all of its children by object name
+        panel_key = (
+            get_color("panel_bg", get_color("card_bg", "#2a2c33")),
+            get_color("panel_border", get_color("border", "#3f4147")),
+            get_color("text_primary", "#e5e7eb"),
+            get_color("text_secondary", "#9ca3af"),
+            get_font_size("size_large", 16),
+            get_font_size("size_small", 12),
+            get_color("hover_bg", "rgba(255, 255, 255, 0.03)"),
+            get_color("border", "rgba(255, 255, 255, 0.1)"),
+        )
+        panel_qss = self._panel_qss_cache.get(panel_key)
+        if panel_qss is None:
+            panel_qss = self._panel_qss_cache[panel_key] = self._build_panel_qss(*panel_key)
+        self.panel.setStyleSheet(panel_qss)
+
+    @staticmethod
+    def _build_panel_qss(panel_bg: str, panel_border: str, title_color: str,
+                         subtitle_color: str, title_size: int, subtitle_size: int,
+                         status_bg: str, status_border: str) -> str:
+        """Build the panel stylesheet for the given theme values"""
+        return (
             f"""
             #panel {{
                 background: {panel_bg};
@@ -165,13 +261,8 @@ class ModulePalette(QWidget):
                 color: {subtitle_color};
                 font-size: {subtitle_size}px;
             }}
-            """
-        )
-
-        self.status_label.setStyleSheet(
-            f"""
-            QLabel {{
-                color: {status_text};
+            QLabel#panelStatus {{
+                color: {subtitle_color};
                 font-size: {subtitle_size}px;
                 padding: 6px;
                 background: {status_bg};
@@ -183,12 +274,15 @@ class ModulePalette(QWidget):
 
     def refresh_style(self):
         """Refresh theme styles"""
+        self._apply_style()
+        self.tree.refresh_style()
+
+    def _on_language_changed(self, _lang_code: str):
+        """Re-translate panel and tree labels"""
         self.title.setText(tr("modules.panel_title", "Node Library"))
         self.subtitle.setText(tr("modules.panel_subtitle", "Drag to canvas"))
         self.status_label.setText(tr("modules.status_ready", "Graph editor ready"))
-        self._apply_style()
-        self.tree.refresh_style()
-        self._populate_tree()
+        self._retranslate_tree()
 
     def _on_item_double_clicked(self, item: QTreeWidgetItem):
         payload = item.data(0, Qt.UserRole)
@@ -197,76 +291,21 @@ class ModulePalette(QWidget):
         self.node_requested.emit(payload)
 
     def _populate_tree(self):
-        self.tree.clear()
-
-        system_root = QTreeWidgetItem([tr("modules.system_nodes", "System Nodes")])
-        custom_root = QTreeWidgetItem([tr("modules.custom_nodes", "Custom Nodes")])
-        system_root.setExpanded(True)
-        custom_root.setExpanded(True)
-        self.tree.addTopLevelItem(system_root)
-        self.tree.addTopLevelItem(custom_root)
-
-        action_group = QTreeWidgetItem([tr("modules.action_nodes", "Action Nodes")])
-        logic_group = QTreeWidgetItem([tr("modules.logic_nodes", "Logic Nodes")])
-        sensor_group = QTreeWidgetItem([tr("modules.sensor_nodes", "Sensor Nodes")])
-        utility_group = QTreeWidgetItem([tr("modules.utility_nodes", "Utility Nodes")])
-
-        system_root.addChild(action_group)
-        system_root.addChild(logic_group)
-        system_root.addChild(sensor_group)
-        system_root.addChild(utility_group)
-
-        # Action nodes
-        self._add_node_item(action_group, "ActionExecutionNode", {
-            "title": "Action Execution",
-            "features": ["Lift Right Leg", "Stand", "Sit", "Walk", "Stop"],
-            "preset": "Stand"
-        })
-        self._add_node_item(action_group, "StopNode", {
-            "title": "Action Execution",
-            "features": ["Lift Right Leg", "Stand", "Sit", "Walk", "Stop"],
-            "preset": "Stop"
-        })
+        # (item, localisation key, default) for every translated label in the tree
+        self._tr_items = []
 
-        # Logic nodes
-        self._add_node_item(logic_group, "IfNode", {
-            "title": "Logic Control",
-            "features": ["If", "While Loop"],
-            "preset": "If"
-        })
-        self._add_node_item(logic_group, "WhileLoopNode", {
-            "title": "Logic Control",
-            "features": ["If", "While Loop"],
-            "preset": "While Loop"
-        })
-        self._add_node_item(logic_group, "ComparisonNode", {
-            "title": "Condition",
-            "features": ["Equal", "Not Equal", "Greater Than", "Less Than", "Greater Equal", "Less Equal"],
-            "preset": "Equal"
-        })
-
-        # Sensor nodes
-        self._add_node_item(sensor_group, "SensorInputNode", {
-            "title": "Sensor Input",
-            "features": ["Read Ultrasonic", "Read Infrared", "Read Camera", "Read IMU", "Read Odometry"],
-            "preset": "Read IMU"
-        })
+        # Build both branches detached and insert them with a single model update
+        system_root = self._add_label_item(None, "modules.system_nodes", "System Nodes")
+        custom_root = self._add_label_item(None, "modules.custom_nodes", "Custom Nodes")
 
-        # Utility nodes
-        self._add_node_item(utility_group, "MathNode", {
-            "title": "Math",
-            "features": ["Add", "Subtract", "Multiply", "Divide", "Power", "Modulo", "Min", "Max", "Abs", "Sum", "Average"],
-            "preset": "Add"
-        })
-        self._add_node_item(utility_group, "TimerNode", {
-            "title": "Timer",
-            "features": []
-        })
+        for group_key, group_default, nodes in _NODE_SCHEMA:
+            group = self._add_label_item(system_root, group_key, group_default)
+            for label, payload in nodes:
+                self._add_node_item(group, label, dict(payload))
 
         custom_nodes = get_custom_nodes()
         if not custom_nodes:
-            empty = QTreeWidgetItem([tr("modules.no_custom_nodes", "(no custom nodes)")])
-            custom_root.addChild(empty)
+            self._add_label_item(custom_root, "modules.no_custom_nodes", "(no custom nodes)")
         else:
             for node_type in sorted(custom_nodes.keys()):
                 self._add_node_item(custom_root, node_type, {
@@ -275,7 +314,25 @@ class ModulePalette(QWidget):
                     "preset": node_type
                 })
 
-        self.tree.expandAll()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.clear()
+            self.tree.addTopLevelItems([system_root, custom_root])
+            self.tree.expandAll()
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def _retranslate_tree(self):
+        """Update translated tree labels in place"""
+        for item, key, default in self._tr_items:
+            item.setText(0, tr(key, default))
+
+    def _add_label_item(self, parent: Optional[QTreeWidgetItem], key: str, default: str) -> QTreeWidgetItem:
+        item = QTreeWidgetItem([tr(key, default)])
+        if parent is not None:
+            parent.addChild(item)
+        self._tr_items.append((item, key, default))
+        return item
 
     def _add_node_item(self, parent: QTreeWidgetItem, label: str, payload: Optional[Dict[str, Any]] = None):
         item = QTreeWidgetItem([label])
@@ -284,4 +341,6 @@ class ModulePalette(QWidget):
         if "draggable" not in data:
             data["draggable"] = True
         item.setData(0, Qt.UserRole, data)
+        # The payload never changes, so encode it once as the QByteArray QMimeData takes
+        item.setData(0, _PAYLOAD_BYTES_ROLE, QByteArray(_dumps_payload(data)))
         parent.addChild(item)
@@ -9,23 +9,35 @@ import configparser
 from pathlib import Path
 from typing import Optional, Any
 
+from bin.core.data_manager import get_data_manager
+
 
 class ConfigManager:
     """配置管理器"""
     
-    def __init__(self):
-        """初始化配置管理器"""
+    def __init__(self, config_dir: Optional[Path] = None):
+        """
+        初始化配置管理器
+        
+        Args:
+            config_dir: 配置目录，默认为项目根目录下的 config
+        """
         # 获取项目根目录
         self.project_root = Path(__file__).parent.parent.parent.absolute()
         
         # 配置文件路径
-        self.config_dir = self.project_root / "config"
+        self.config_dir = Path(config_dir) if config_dir else self.project_root / "config"
         self.system_config_path = self.config_dir / "system.ini"
         self.user_config_path = self.config_dir / "user.ini"
         
-        # 创建配置解析器
-        self.system_config = configparser.ConfigParser()
-        self.user_config = configparser.ConfigParser()
+        # 配置解析器由 DataManager 统一缓存，与其他读取方共享同一份；
+        # 每次访问都重新获取，DataManager 重新加载后不会继续使用旧对象
+        self._data_manager = get_data_manager()
+        
+        # 派生值缓存（set 或重新加载时清空）
+        self._path_cache: dict = {}
+        self._robots_cache: Optional[list] = None
+        self._cached_from: Optional[configparser.ConfigParser] = None
         
         # 加载配置文件
         self._load_configs()
@@ -38,20 +50,55 @@ class ConfigManager:
         # 确保配置目录存在
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
+        system_exists = self.system_config_path.exists()
+        user_exists = self.user_config_path.exists()
+        
+        # 文件不存在时 DataManager 返回空的解析器，再填入默认值
+        self._data_manager.load_ini(str(self.system_config_path))
+        self._data_manager.load_ini(str(self.user_config_path))
+        
         # 加载系统配置
-        if self.system_config_path.exists():
-            self.system_config.read(self.system_config_path, encoding='utf-8')
-        else:
+        if not system_exists:
             self._create_default_system_config()
         
         # 加载用户配置
-        if self.user_config_path.exists():
-            self.user_config.read(self.user_config_path, encoding='utf-8')
-        else:
+        if not user_exists:
             self._create_default_user_config()
+        
+        self._invalidate_caches()
+    
+    @property
+    def system_config(self) -> configparser.ConfigParser:
+        """系统配置解析器（DataManager 当前缓存的对象）"""
+        return self._data_manager.read_ini(str(self.system_config_path))
+    
+    @property
+    def user_config(self) -> configparser.ConfigParser:
+        """用户配置解析器（DataManager 当前缓存的对象）"""
+        return self._data_manager.read_ini(str(self.user_config_path))
+    
+    def _config(self, config_type: str) -> configparser.ConfigParser:
+        """按配置类型获取解析器，未知类型按用户配置处理"""
+        return self.system_config if config_type == 'system' else self.user_config
+    
+    def _invalidate_caches(self):
+        """清空派生值缓存"""
+        self._path_cache.clear()
+        self._robots_cache = None
+    
+    def _check_caches(self):
+        """系统配置被 DataManager 重新加载后，派生值缓存随之失效"""
+        config = self.system_config
+        if config is not self._cached_from:
+            self._invalidate_caches()
+            self._cached_from = config
     
     def _update_project_root(self):
         """更新配置文件中的项目根路径"""
+        # 路径未变化时跳过写盘
+        if self.get('PATH', 'project_root') == str(self.project_root):
+            return
+        
         if not self.system_config.has_section('PATH'):
             self.system_config.add_section('PATH')
         
@@ -137,7 +184,7 @@ class ConfigManager:
         Returns:
             配置值
         """
-        config = self.system_config if config_type == 'system' else self.user_config
+        config = self._config(config_type)
         
         try:
             return config.get(section, option, fallback=fallback)
@@ -147,7 +194,7 @@ class ConfigManager:
     def get_int(self, section: str, option: str, fallback: int = 0,
                 config_type: str = 'system') -> int:
         """获取整数配置值"""
-        config = self.system_config if config_type == 'system' else self.user_config
+        config = self._config(config_type)
         try:
             return config.getint(section, option, fallback=fallback)
         except (configparser.NoSectionError, configparser.NoOptionError):
@@ -156,7 +203,7 @@ class ConfigManager:
     def get_float(self, section: str, option: str, fallback: float = 0.0,
                   config_type: str = 'system') -> float:
         """获取浮点数配置值"""
-        config = self.system_config if config_type == 'system' else self.user_config
+        config = self._config(config_type)
         try:
             return config.getfloat(section, option, fallback=fallback)
         except (configparser.NoSectionError, configparser.NoOptionError):
@@ -165,7 +212,7 @@ class ConfigManager:
     def get_bool(self, section: str, option: str, fallback: bool = False,
                  config_type: str = 'system') -> bool:
         """获取布尔配置值"""
-        config = self.system_config if config_type == 'system' else self.user_config
+        config = self._config(config_type)
         try:
             return config.getboolean(section, option, fallback=fallback)
         except (configparser.NoSectionError, configparser.NoOptionError):
@@ -182,22 +229,26 @@ class ConfigManager:
             value: 配置值
             config_type: 配置类型 ('system' 或 'user')
         """
-        config = self.system_config if config_type == 'system' else self.user_config
+        config = self._config(config_type)
         
         if not config.has_section(section):
             config.add_section(section)
         
         config.set(section, option, str(value))
+        self._invalidate_caches()
     
-    def save_system_config(self):
-        """保存系统配置"""
-        with open(self.system_config_path, 'w', encoding='utf-8') as f:
-            self.system_config.write(f)
+    def _save(self, path: Path) -> bool:
+        """写入配置文件并等待落盘"""
+        path = str(path)
+        return self._data_manager.up_ini(path) and self._data_manager.flush(file_path=path)
     
-    def save_user_config(self):
-        """保存用户配置"""
-        with open(self.user_config_path, 'w', encoding='utf-8') as f:
-            self.user_config.write(f)
+    def save_system_config(self) -> bool:
+        """保存系统配置，写入磁盘后返回；写入失败返回 False"""
+        return self._save(self.system_config_path)
+    
+    def save_user_config(self) -> bool:
+        """保存用户配置，写入磁盘后返回；写入失败返回 False"""
+        return self._save(self.user_config_path)
     
     def get_path(self, path_key: str) -> Path:
         """
@@ -209,20 +260,29 @@ class ConfigManager:
         Returns:
             Path对象
         """
+        self._check_caches()
+        path = self._path_cache.get(path_key)
+        if path is not None:
+            return path
+        
         path_str = self.get('PATH', path_key, fallback='')
         
         if not path_str:
-            return self.project_root
-        
-        path = Path(path_str)
-        
-        # 如果是相对路径，转换为绝对路径
-        if not path.is_absolute():
-            path = self.project_root / path
+            path = self.project_root
+        else:
+            path = Path(path_str)
+            
+            # 如果是相对路径，转换为绝对路径
+            if not path.is_absolute():
+                path = self.project_root / path
         
+        self._path_cache[path_key] = path
         return path
     
     def get_available_robots(self) -> list:
         """获取可用机器人列表"""
-        robots_str = self.get('SIMULATION', 'available_robots', fallback='go2')
-        return [r.strip() for r in robots_str.split(',')]
+        self._check_caches()
+        if self._robots_cache is None:
+            robots_str = self.get('SIMULATION', 'available_robots', fallback='go2')
+            self._robots_cache = [r.strip() for r in robots_str.split(',')]
+        return list(self._robots_cache)
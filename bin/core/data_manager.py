@@ -5,12 +5,39 @@
 支持线程安全的INI和JSON文件读写
 """
 
+import io
 import os
+import atexit
 import json
+import hashlib
 import threading
 import configparser
+from copy import deepcopy
 from pathlib import Path
-from typing import Optional, Any
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
+
+# JSON 编解码：优先使用 orjson（直接处理 UTF-8 bytes），不可用时回退到标准库
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+# value_type -> ConfigParser 取值方法名
+_INI_GETTERS = {
+    int: 'getint',
+    float: 'getfloat',
+    bool: 'getboolean',
+    str: 'get',
+}
 
 
 class DataManager:
@@ -21,36 +48,151 @@ class DataManager:
     """
     
     _instance: Optional['DataManager'] = None
-    _initialized: bool = False
     _lock = threading.RLock()  # 可重入锁
+    _FILE_LOCK_STRIPES = 32  # 文件锁分段数（2 的幂）
     
     def __new__(cls):
+        # 已创建时直接返回，不再加锁
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super().__new__(cls)
+                instance = super().__new__(cls)
+                instance._setup()
+                cls._instance = instance
             return cls._instance
     
-    def __init__(self):
-        if DataManager._initialized:
-            return
+    def _setup(self):
+        """一次性初始化（仅在创建单例时调用）"""
+        self._ini_cache: dict[str, configparser.ConfigParser] = {}
+        self._json_cache: dict[str, dict] = {}
+        # 按路径哈希分段的文件锁，不同文件基本不会争用同一把锁
+        self._file_locks = tuple(threading.RLock() for _ in range(self._FILE_LOCK_STRIPES))
+        # 最近一次写入内容的摘要，内容未变化时跳过写盘
+        self._written_digests: dict[str, bytes] = {}
+        # 路径 -> 绝对路径，避免重复 resolve() 的文件系统调用
+        self._resolved: dict[str, str] = {}
         
-        with DataManager._lock:
-            if DataManager._initialized:
-                return
+        # 后台写线程：up_ini/up_json 只更新缓存并登记待写内容，同一文件只保留最新一份
+        self._write_cond = threading.Condition()
+        self._pending_writes: dict[str, bytes] = {}
+        self._writing_path: Optional[str] = None
+        # 最近一次写入失败的文件 -> 异常，该文件再次写入成功后移除
+        self._write_errors: dict[str, Exception] = {}
+        self._writer: Optional[threading.Thread] = None
+    
+    # ========================================================================
+    # 后台写入
+    # ========================================================================
+    
+    def _queue_write(self, abs_path: str, content: bytes):
+        """登记待写内容并唤醒写线程"""
+        with self._write_cond:
+            self._pending_writes[abs_path] = content
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop,
+                                                name="DataManagerWriter", daemon=True)
+                self._writer.start()
+                # 解释器退出前写完剩余内容
+                atexit.register(self.flush)
+            self._write_cond.notify_all()
+    
+    def _write_loop(self):
+        """写线程主循环"""
+        while True:
+            with self._write_cond:
+                while not self._pending_writes:
+                    self._write_cond.wait()
+                abs_path = next(iter(self._pending_writes))
+                content = self._pending_writes.pop(abs_path)
+                self._writing_path = abs_path
             
-            self._ini_cache: dict[str, configparser.ConfigParser] = {}
-            self._json_cache: dict[str, dict] = {}
-            self._file_locks: dict[str, threading.RLock] = {}
+            error = None
+            try:
+                self._write_if_changed(abs_path, content)
+            except Exception as e:
+                error = e
+                print(f"[DataManager] Error writing {abs_path}: {e}")
+            finally:
+                with self._write_cond:
+                    if error is None:
+                        self._write_errors.pop(abs_path, None)
+                    else:
+                        self._write_errors[abs_path] = error
+                    self._writing_path = None
+                    self._write_cond.notify_all()
+    
+    def _wait_for_write(self, abs_path: str):
+        """等待指定文件的待写内容落盘"""
+        with self._write_cond:
+            self._write_cond.wait_for(
+                lambda: abs_path not in self._pending_writes and self._writing_path != abs_path)
+    
+    def flush(self, timeout: Optional[float] = None, file_path: str = None) -> bool:
+        """
+        等待待写内容落盘
+        
+        Args:
+            timeout: 最长等待秒数，None 表示一直等待
+            file_path: 只等待该文件；为 None 时等待所有文件
+        
+        Returns:
+            全部写入成功返回 True；超时或有文件最近一次写入失败返回 False
+        """
+        if file_path is None:
+            def done():
+                return not self._pending_writes and self._writing_path is None
+        else:
+            abs_path = self._abs(file_path)
             
-            DataManager._initialized = True
+            def done():
+                return abs_path not in self._pending_writes and self._writing_path != abs_path
+        
+        with self._write_cond:
+            if not self._write_cond.wait_for(done, timeout):
+                return False
+            if file_path is None:
+                return not self._write_errors
+            return abs_path not in self._write_errors
+    
+    def _write_if_changed(self, abs_path: str, content: bytes) -> None:
+        """内容与上次写入不同时才写文件（仅由写线程调用）"""
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if self._written_digests.get(abs_path) == digest and os.path.exists(abs_path):
+            return
+        
+        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+        
+        # 先写同目录临时文件再原子替换，写入中途崩溃不会留下半截文件
+        tmp_path = f"{abs_path}.tmp.{os.getpid()}"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, abs_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        self._written_digests[abs_path] = digest
+    
+    def _abs(self, file_path: str) -> str:
+        """获取绝对路径（带缓存；dict 读写本身是原子的，重复计算无害）"""
+        abs_path = self._resolved.get(file_path)
+        if abs_path is None:
+            abs_path = str(Path(file_path).resolve())
+            # 相对路径依赖当前工作目录，只缓存绝对路径输入
+            if os.path.isabs(file_path):
+                self._resolved[file_path] = abs_path
+            self._resolved[abs_path] = abs_path
+        return abs_path
     
     def _get_file_lock(self, file_path: str) -> threading.RLock:
-        """获取文件专用锁"""
-        abs_path = str(Path(file_path).resolve())
-        with DataManager._lock:
-            if abs_path not in self._file_locks:
-                self._file_locks[abs_path] = threading.RLock()
-            return self._file_locks[abs_path]
+        """获取文件专用锁（无需全局锁）"""
+        abs_path = self._abs(file_path)
+        return self._file_locks[hash(abs_path) & (self._FILE_LOCK_STRIPES - 1)]
     
     # ========================================================================
     # INI 文件操作
@@ -58,7 +200,7 @@ class DataManager:
     
     def load_ini(self, file_path: str, force_reload: bool = False) -> configparser.ConfigParser:
         """初始读取 INI 文件到缓存（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
+        abs_path = self._abs(file_path)
         file_lock = self._get_file_lock(abs_path)
         
         with file_lock:
@@ -66,6 +208,10 @@ class DataManager:
                 return self._ini_cache[abs_path]
             
             config = configparser.ConfigParser()
+            # 先等本文件的待写内容落盘，再从磁盘读取
+            self._wait_for_write(abs_path)
+            # 磁盘内容可能已被外部修改，下次写入不能跳过
+            self._written_digests.pop(abs_path, None)
             
             if os.path.exists(abs_path):
                 config.read(abs_path, encoding='utf-8')
@@ -75,7 +221,7 @@ class DataManager:
     
     def read_ini(self, file_path: str) -> configparser.ConfigParser:
         """读取 INI 缓存（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
+        abs_path = self._abs(file_path)
         file_lock = self._get_file_lock(abs_path)
         
         with file_lock:
@@ -85,8 +231,13 @@ class DataManager:
     
     def up_ini(self, file_path: str, section: str = None, key: str = None, value: Any = None, 
                data: dict = None) -> bool:
-        """更新 INI 文件并重载缓存（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
+        """
+        更新 INI 缓存并交由后台线程写文件（线程安全）
+        
+        Returns:
+            缓存更新成功返回 True；此时文件尚未写入，写入结果由 flush() 返回
+        """
+        abs_path = self._abs(file_path)
         file_lock = self._get_file_lock(abs_path)
         
         with file_lock:
@@ -105,10 +256,9 @@ class DataManager:
                         for k, v in items.items():
                             config.set(sec, k, str(v))
                 
-                os.makedirs(os.path.dirname(abs_path), exist_ok=True)
-                
-                with open(abs_path, 'w', encoding='utf-8') as f:
-                    config.write(f)
+                buffer = io.StringIO()
+                config.write(buffer)
+                self._queue_write(abs_path, buffer.getvalue().encode('utf-8'))
                 
                 self._ini_cache[abs_path] = config
                 return True
@@ -120,23 +270,14 @@ class DataManager:
     def get_ini_value(self, file_path: str, section: str, key: str, 
                       fallback: Any = None, value_type: type = str) -> Any:
         """获取 INI 值（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
-        file_lock = self._get_file_lock(abs_path)
+        # 仅在取缓存时持有文件锁
+        config = self.read_ini(file_path)
+        getter = getattr(config, _INI_GETTERS.get(value_type, 'get'))
         
-        with file_lock:
-            config = self.read_ini(file_path)
-            
-            try:
-                if value_type == int:
-                    return config.getint(section, key, fallback=fallback)
-                elif value_type == float:
-                    return config.getfloat(section, key, fallback=fallback)
-                elif value_type == bool:
-                    return config.getboolean(section, key, fallback=fallback)
-                else:
-                    return config.get(section, key, fallback=fallback)
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                return fallback
+        try:
+            return getter(section, key, fallback=fallback)
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            return fallback
     
     # ========================================================================
     # JSON 文件操作
@@ -144,7 +285,7 @@ class DataManager:
     
     def load_json(self, file_path: str, force_reload: bool = False) -> dict:
         """初始读取 JSON 文件到缓存（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
+        abs_path = self._abs(file_path)
         file_lock = self._get_file_lock(abs_path)
         
         with file_lock:
@@ -152,31 +293,48 @@ class DataManager:
                 return self._json_cache[abs_path]
             
             data = {}
+            self._wait_for_write(abs_path)
+            self._written_digests.pop(abs_path, None)
             
             if os.path.exists(abs_path):
                 try:
-                    with open(abs_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    with open(abs_path, 'rb') as f:
+                        data = _json_loads(f.read())
                 except json.JSONDecodeError as e:
                     print(f"[DataManager] JSON decode error: {e}")
             
             self._json_cache[abs_path] = data
             return data
     
-    def read_json(self, file_path: str) -> dict:
-        """读取 JSON 缓存（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
+    def read_json(self, file_path: str, copy: bool = True) -> dict:
+        """
+        读取 JSON 缓存（线程安全）
+        
+        默认返回深拷贝，调用方修改返回值不会影响缓存；
+        copy=False 时返回缓存对象本身
+        """
+        abs_path = self._abs(file_path)
         file_lock = self._get_file_lock(abs_path)
         
         with file_lock:
-            if abs_path not in self._json_cache:
-                return self.load_json(file_path)
-            return self._json_cache[abs_path]
+            data = self._json_cache.get(abs_path)
+            if data is None:
+                data = self.load_json(file_path)
+            return deepcopy(data) if copy else data
+    
+    def read_json_readonly(self, file_path: str) -> Mapping[str, Any]:
+        """读取 JSON 缓存的只读视图（不复制，仅顶层只读）"""
+        return MappingProxyType(self.read_json(file_path, copy=False))
     
     def up_json(self, file_path: str, data: dict = None, 
                 key: str = None, value: Any = None, merge: bool = True) -> bool:
-        """更新 JSON 文件并重载缓存（线程安全）"""
-        abs_path = str(Path(file_path).resolve())
+        """
+        更新 JSON 缓存并交由后台线程写文件（线程安全）
+        
+        Returns:
+            缓存更新成功返回 True；此时文件尚未写入，写入结果由 flush() 返回
+        """
+        abs_path = self._abs(file_path)
         file_lock = self._get_file_lock(abs_path)
         
         with file_lock:
@@ -192,10 +350,7 @@ class DataManager:
                     else:
                         current_data = data
                 
-                os.makedirs(os.path.dirname(abs_path), exist_ok=True)
-                
-                with open(abs_path, 'w', encoding='utf-8') as f:
-                    json.dump(current_data, f, ensure_ascii=False, indent=2)
+                self._queue_write(abs_path, _json_dumps(current_data))
                 
                 self._json_cache[abs_path] = current_data
                 return True
@@ -212,7 +367,7 @@ class DataManager:
         """清除缓存"""
         with DataManager._lock:
             if file_path:
-                abs_path = str(Path(file_path).resolve())
+                abs_path = self._abs(file_path)
                 self._ini_cache.pop(abs_path, None)
                 self._json_cache.pop(abs_path, None)
             else:
@@ -247,31 +402,38 @@ def get_data_manager() -> DataManager:
     return _data_manager
 
 
+# 扩展名 -> (load, read, up)
+_HANDLERS = {
+    'ini': (DataManager.load_ini, DataManager.read_ini, DataManager.up_ini),
+    'json': (DataManager.load_json, DataManager.read_json, DataManager.up_json),
+}
+
+
+def _handlers_for(file_path: str):
+    """按扩展名查找处理函数，未知类型返回 None"""
+    _, dot, ext = file_path.rpartition('.')
+    return _HANDLERS.get(ext) if dot else None
+
+
 def load_data(file_path: str):
     """加载数据文件到缓存"""
-    dm = get_data_manager()
-    if file_path.endswith('.ini'):
-        dm.load_ini(file_path)
-    elif file_path.endswith('.json'):
-        dm.load_json(file_path)
+    handlers = _handlers_for(file_path)
+    if handlers:
+        handlers[0](get_data_manager(), file_path)
 
 
 def read_data(file_path: str):
     """读取数据文件"""
-    dm = get_data_manager()
-    if file_path.endswith('.ini'):
-        return dm.read_ini(file_path)
-    elif file_path.endswith('.json'):
-        return dm.read_json(file_path)
+    handlers = _handlers_for(file_path)
+    if handlers:
+        return handlers[1](get_data_manager(), file_path)
 
 
 def up_data(file_path: str, **kwargs) -> bool:
     """更新数据文件"""
-    dm = get_data_manager()
-    if file_path.endswith('.ini'):
-        return dm.up_ini(file_path, **kwargs)
-    elif file_path.endswith('.json'):
-        return dm.up_json(file_path, **kwargs)
+    handlers = _handlers_for(file_path)
+    if handlers:
+        return handlers[2](get_data_manager(), file_path, **kwargs)
     return False
 
 
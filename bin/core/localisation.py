@@ -5,13 +5,34 @@ Localisation Module
 Provides internationalization support for the application
 """
 
+import os
+import sys
 import json
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from PySide6.QtCore import QObject, Signal
 
+# Prefer orjson for language files (parses UTF-8 bytes in C); fall back to stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Only these exact types are memoized: other objects would be kept alive by the
+# cache, and their str() can change after the result was cached
+_CACHEABLE_TYPES = frozenset((str, int, float, bool))
+
+
+@lru_cache(maxsize=512)
+def _format_cached(template: str, items: tuple) -> str:
+    """Format a template; items is ((name, type, value), ...) so equal-but-distinct values (1 / True) don't collide"""
+    return template.format_map({name: value for name, _, value in items})
+
 
 class LocalisationManager(QObject):
     """Localisation manager - singleton pattern"""
@@ -30,6 +51,10 @@ class LocalisationManager(QObject):
     DEFAULT_LANGUAGE = "en"
 
     def __new__(cls):
+        # Fast path: no lock once the instance exists
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
@@ -44,14 +69,14 @@ class LocalisationManager(QObject):
         self._initialized = True
         self._current_language = self.DEFAULT_LANGUAGE
         self._translations: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}  # "a.b.c" -> leaf (str / list)
         self._localisation_dir: Optional[Path] = None
+        self._loaded = False  # Language file is read on first lookup
+        self._available_cache: Optional[Dict[str, str]] = None
 
         # Auto-detect localisation directory
         self._detect_localisation_dir()
 
-        # Load default language
-        self.load_language(self._current_language)
-
     def _detect_localisation_dir(self):
         """Detect localisation directory"""
         # Try to find from current file location
@@ -59,6 +84,7 @@ class LocalisationManager(QObject):
         project_root = current_file.parent.parent.parent
         localisation_dir = project_root / "localisation"
 
+        self._available_cache = None
         if localisation_dir.exists():
             self._localisation_dir = localisation_dir
         else:
@@ -69,6 +95,7 @@ class LocalisationManager(QObject):
     def set_localisation_dir(self, path: str):
         """Set localisation directory path"""
         self._localisation_dir = Path(path)
+        self._available_cache = None
 
     def load_language(self, lang_code: str) -> bool:
         """
@@ -80,25 +107,79 @@ class LocalisationManager(QObject):
         Returns:
             True if successful, False otherwise
         """
-        if not self._localisation_dir:
+        loaded = self._read_language(lang_code)
+        if loaded is None:
             return False
+        self.language_changed.emit(loaded)
+        return True
+
+    def _read_language(self, lang_code: str) -> Optional[str]:
+        """Read a language file (falling back to the default); returns the loaded code or None"""
+        self._loaded = True
+        if not self._localisation_dir:
+            return None
 
         lang_file = self._localisation_dir / f"{lang_code}.json"
 
         if not lang_file.exists():
             # Fallback to default language
             if lang_code != self.DEFAULT_LANGUAGE:
-                return self.load_language(self.DEFAULT_LANGUAGE)
-            return False
+                return self._read_language(self.DEFAULT_LANGUAGE)
+            return None
 
         try:
-            with open(lang_file, "r", encoding="utf-8") as f:
-                self._translations = json.load(f)
+            with open(lang_file, "rb") as f:
+                self._translations = _json_loads(f.read())
+            self._flat = self._flatten(self._translations)
             self._current_language = lang_code
-            self.language_changed.emit(lang_code)
-            return True
+            return lang_code
         except (json.JSONDecodeError, IOError):
-            return False
+            return None
+
+    @staticmethod
+    def _flatten(translations: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Flatten nested translations into dotted keys (str / list leaves only)
+
+        Repeated strings are deduplicated in place (short ones interned), so the
+        nested dict and the flat index share one object per distinct text.
+        """
+        flat: Dict[str, Any] = {}
+        pool: Dict[str, str] = {}
+
+        def canon(s: str) -> str:
+            return pool.setdefault(s, sys.intern(s) if len(s) <= 20 else s)
+
+        def walk(prefix: str, node: Dict[str, Any]):
+            for k, v in node.items():
+                path = f"{prefix}{k}"
+                if isinstance(v, dict):
+                    walk(f"{path}.", v)
+                elif isinstance(v, str):
+                    flat[path] = node[k] = canon(v)
+                elif isinstance(v, list):
+                    flat[path] = node[k] = [canon(s) if isinstance(s, str) else s for s in v]
+
+        if isinstance(translations, dict):
+            walk("", translations)
+        return flat
+
+    def _lookup_nested(self, key: str) -> Any:
+        """Walk the nested translations (cold path for keys missing from the flat index)"""
+        value = self._translations
+        try:
+            for k in key.split("."):
+                value = value[k]
+        except (KeyError, TypeError):
+            return None
+        return value
+
+    @staticmethod
+    def _format(template: str, kwargs: Dict[str, Any]) -> str:
+        """Format a template, reusing the cached result when all arguments are plain values"""
+        if all(type(v) in _CACHEABLE_TYPES for v in kwargs.values()):
+            return _format_cached(template, tuple(sorted((k, type(v), v) for k, v in kwargs.items())))
+        return template.format_map(kwargs)
 
     def get(self, key: str, default: str = "", **kwargs) -> str:
         """
@@ -112,23 +193,24 @@ class LocalisationManager(QObject):
         Returns:
             Translated text
         """
-        keys = key.split(".")
-        value = self._translations
-
-        try:
-            for k in keys:
-                value = value[k]
-
-            if isinstance(value, str):
-                # Support format strings like "Hello {name}"
-                if kwargs:
-                    return value.format(**kwargs)
-                return value
-            elif isinstance(value, list):
-                return value  # Return list as-is (for features)
-            else:
-                return default
-        except (KeyError, TypeError):
+        if not self._loaded:
+            self._read_language(self._current_language)
+
+        value = self._flat.get(key)
+        if value is None:
+            value = self._lookup_nested(key)
+
+        if isinstance(value, str):
+            # Support format strings like "Hello {name}"
+            if kwargs:
+                try:
+                    return self._format(value, kwargs)
+                except KeyError:
+                    return default
+            return value
+        elif isinstance(value, list):
+            return value  # Return list as-is (for features)
+        else:
             return default
 
     def get_list(self, key: str, default: list = None) -> list:
@@ -158,20 +240,32 @@ class LocalisationManager(QObject):
         return self.SUPPORTED_LANGUAGES.get(self._current_language, "Unknown")
 
     def get_available_languages(self) -> Dict[str, str]:
-        """Get available languages (code -> name)"""
-        available = {}
-        if self._localisation_dir:
-            for lang_code, lang_name in self.SUPPORTED_LANGUAGES.items():
-                lang_file = self._localisation_dir / f"{lang_code}.json"
-                if lang_file.exists():
-                    available[lang_code] = lang_name
-        return available
+        """Get available languages (code -> name), scanned once per localisation directory"""
+        if self._available_cache is None:
+            on_disk = set()
+            if self._localisation_dir:
+                # One directory read instead of a stat per supported language
+                try:
+                    with os.scandir(self._localisation_dir) as it:
+                        on_disk = {e.name[:-5] for e in it
+                                   if e.name.endswith(".json") and e.is_file()}
+                except OSError:
+                    pass
+            self._available_cache = {code: name for code, name in self.SUPPORTED_LANGUAGES.items()
+                                     if code in on_disk}
+        return dict(self._available_cache)
 
 
 # Global instance getter
+_localisation: Optional[LocalisationManager] = None
+
+
 def get_localisation() -> LocalisationManager:
     """Get global localisation manager instance"""
-    return LocalisationManager()
+    global _localisation
+    if _localisation is None:
+        _localisation = LocalisationManager()
+    return _localisation
 
 
 # Shorthand function for translation
@@ -187,7 +281,7 @@ def tr(key: str, default: str = "", **kwargs) -> str:
     Returns:
         Translated text
     """
-    return get_localisation().get(key, default, **kwargs)
+    return (_localisation or get_localisation()).get(key, default, **kwargs)
 
 
 def tr_list(key: str, default: list = None) -> list:
@@ -201,4 +295,4 @@ def tr_list(key: str, default: list = None) -> list:
     Returns:
         Translated list
     """
-    return get_localisation().get_list(key, default)
+    return (_localisation or get_localisation()).get_list(key, default)
@@ -5,16 +5,17 @@ Logger Module
 Thread-safe log signal transmission and UI display
 """
 
+import time
 import threading
-from typing import Optional
-from datetime import datetime
+from collections import deque
+from typing import Optional, Dict
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QHBoxLayout, QPushButton, QLabel
-from PySide6.QtCore import Qt, QObject, Signal, QThread
+from PySide6.QtCore import Qt, QObject, Signal, QTimer
 from PySide6.QtGui import QColor, QTextCursor, QTextCharFormat
 
 from bin.core.theme_manager import get_color, get_font_size
-from bin.core.localisation import tr
+from bin.core.localisation import tr, get_localisation
 
 
 # ============================================================================
@@ -30,6 +31,9 @@ class LogSignal(QObject):
 
     @classmethod
     def instance(cls) -> "LogSignal":
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = cls()
@@ -55,6 +59,21 @@ class LogSignal(QObject):
         self.emit_log(text, "success", wrap, typer)
 
 
+# Whether log_debug messages are emitted (DEBUG/verbose_logging in system.ini)
+_debug_enabled = True
+
+
+def set_debug_enabled(enabled: bool):
+    """Enable or disable debug-level logs"""
+    global _debug_enabled
+    _debug_enabled = bool(enabled)
+
+
+def is_debug_enabled() -> bool:
+    """Check before building expensive debug messages"""
+    return _debug_enabled
+
+
 def get_log_signal() -> LogSignal:
     """Get global log signal instance"""
     return LogSignal.instance()
@@ -62,65 +81,86 @@ def get_log_signal() -> LogSignal:
 
 def log(text, log_type="info", wrap=True, typer=False):
     """Send log"""
-    text = str(text)
+    if type(text) is not str:
+        text = str(text)
     get_log_signal().emit_log(text, log_type, wrap, typer)
 
 
 def log_info(text, wrap=True, typer=False):
     """Info log"""
-    text = str(text)
+    if type(text) is not str:
+        text = str(text)
     get_log_signal().info(text, wrap, typer)
 
 
 def log_debug(text, wrap=True, typer=False):
     """Debug log"""
-    text = str(text)
+    if not _debug_enabled:
+        return
+    if type(text) is not str:
+        text = str(text)
     get_log_signal().debug(text, wrap, typer)
 
 
 def log_warning(text, wrap=True, typer=False):
     """Warning log"""
-    text = str(text)
+    if type(text) is not str:
+        text = str(text)
     get_log_signal().warning(text, wrap, typer)
 
 
 def log_error(text, wrap=True, typer=False):
     """Error log"""
-    text = str(text)
+    if type(text) is not str:
+        text = str(text)
     get_log_signal().error(text, wrap, typer)
 
 
 def log_success(text, wrap=True, typer=False):
     """Success log"""
-    text = str(text)
+    if type(text) is not str:
+        text = str(text)
     get_log_signal().success(text, wrap, typer)
 
 
 # ============================================================================
-# Typer Thread
+# Typer
 # ============================================================================
 
-class TyperThread(QThread):
-    """Typewriter effect thread"""
+class Typer(QObject):
+    """Typewriter effect driver (GUI-thread timer, emits chunks of characters)"""
     char_ready = Signal(str)
     finished = Signal()
 
+    CHUNK_SIZE = 8
+
     def __init__(self, text: str, interval=30):
         super().__init__()
         self._text = text
-        self._interval = interval
-        self._stop = False
+        self._pos = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval * self.CHUNK_SIZE)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._timer.start()
+        self._tick()
+
+    def _tick(self):
+        if self._pos >= len(self._text):
+            self.stop()
+            return
+        chunk = self._text[self._pos:self._pos + self.CHUNK_SIZE]
+        self._pos += self.CHUNK_SIZE
+        self.char_ready.emit(chunk)
 
-    def run(self):
-        for ch in self._text:
-            if self._stop:
-                break
-            self.char_ready.emit(ch)
-            self.msleep(self._interval)
-        self.finished.emit()
+    def isRunning(self) -> bool:
+        return self._timer.isActive()
 
     def stop(self):
-        self._stop = True
+        if self._timer.isActive():
+            self._timer.stop()
+            self.finished.emit()
 
 
 # ============================================================================
@@ -146,14 +186,54 @@ class CmdLogWidget(QWidget):
         "error": "ERROR",
     }
 
+    # Oldest lines are dropped beyond this many (keeps layout cost per append bounded)
+    MAX_LINES = 5000
+
+    # Plain log lines are queued and inserted in one batch per interval
+    FLUSH_INTERVAL_MS = 16
+
+    # Last formatted timestamp, shared by all widgets: [epoch_second, "HH:MM:SS"]
+    _ts_cache = [None, ""]
+
+    _qss_cache: Dict[tuple, str] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._status_start_pos: Optional[int] = None
-        self._typer_thread: Optional[TyperThread] = None
+        self._applied_qss: Optional[str] = None
+        self._typer: Optional[Typer] = None
+        self._pending = deque()  # (timestamp, text, log_type, wrap)
+
+        # Per-type char formats and "[PREFIX] " strings, built once
+        self._formats = {t: self._make_format(c) for t, c in self.LOG_COLORS.items()}
+        self._prefix_str = {t: f"[{p}] " for t, p in self.LOG_PREFIX.items()}
 
         self._init_ui()
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         get_log_signal().log_message.connect(self._on_log)
+        get_localisation().language_changed.connect(self._on_language_changed)
+
+    @staticmethod
+    def _make_format(color: str) -> QTextCharFormat:
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        return fmt
+
+    @classmethod
+    def _timestamp(cls) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        cache = cls._ts_cache
+        if cache[0] != now:
+            cache[0] = now
+            cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+        return cache[1]
 
     def _init_ui(self):
         """Initialize UI"""
@@ -165,24 +245,33 @@ class CmdLogWidget(QWidget):
         hl = QHBoxLayout(header)
         hl.setContentsMargins(10, 5, 10, 5)
 
-        tt = QLabel(tr("console.title", "Console"))
-        tt.setMaximumHeight(35)
-        hl.addWidget(tt)
+        self._title_label = QLabel(tr("console.title", "Console"))
+        self._title_label.setMaximumHeight(35)
+        hl.addWidget(self._title_label)
         hl.addStretch()
 
-        btn = QPushButton(tr("console.clear", "Clear"))
-        btn.clicked.connect(self.clear)
-        hl.addWidget(btn)
+        self._clear_btn = QPushButton(tr("console.clear", "Clear"))
+        self._clear_btn.clicked.connect(self.clear)
+        hl.addWidget(self._clear_btn)
 
         layout.addWidget(header)
 
         # Text editor
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.document().setMaximumBlockCount(self.MAX_LINES)
         layout.addWidget(self.text_edit)
 
+        # Document-bound cursor reused by the typer (avoids textCursor()/setTextCursor() copies)
+        self._typer_cursor = QTextCursor(self.text_edit.document())
+
         self._apply_style()
 
+    def _on_language_changed(self, _lang_code: str):
+        """Re-translate header labels"""
+        self._title_label.setText(tr("console.title", "Console"))
+        self._clear_btn.setText(tr("console.clear", "Clear"))
+
     def _on_log(self, text, log_type, wrap, typer):
         """Handle log message"""
         if typer:
@@ -204,45 +293,65 @@ class CmdLogWidget(QWidget):
         self._status_start_pos = None
 
     def _append_log(self, text, log_type, wrap):
-        """Append log"""
-        cursor = self.text_edit.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+        """Append log (queued, inserted on the next flush)"""
+        self._pending.append((self._timestamp(), text, log_type, wrap))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Insert queued logs, one insertText per run of same-type lines"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
 
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(self.LOG_COLORS.get(log_type, "#FFFFFF")))
+        entries = list(self._pending)
+        self._pending.clear()
 
-        ts = datetime.now().strftime("%H:%M:%S")
-        prefix = self.LOG_PREFIX.get(log_type, "INFO")
-        content = f"[{ts}] [{prefix}] {text}"
+        self._clear_status_line()
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
 
-        if not wrap:
-            self._clear_status_line()
-            self._status_start_pos = cursor.position()
-            cursor.setCharFormat(fmt)
-            cursor.insertText(content)
-        else:
-            self._clear_status_line()
-            cursor.setCharFormat(fmt)
-            cursor.insertText(content + "\n")
+        last = len(entries) - 1
+        run_type, run = None, []
+        for i, (ts, text, log_type, wrap) in enumerate(entries):
+            if not wrap and i != last:
+                continue  # Status line superseded within the same batch
+            if log_type not in self._formats:
+                log_type = "info"
+            if run and log_type != run_type:
+                self._insert_run(cursor, run_type, run)
+                run = []
+            run_type = log_type
+            content = f"[{ts}] {self._prefix_str[log_type]}{text}"
+            if wrap:
+                run.append(content + "\n")
+            else:
+                self._insert_run(cursor, run_type, run)
+                run = [content]
+                self._status_start_pos = cursor.position()
+        self._insert_run(cursor, run_type, run)
 
         self.text_edit.setTextCursor(cursor)
         self.text_edit.ensureCursorVisible()
 
+    def _insert_run(self, cursor, log_type, lines):
+        """Insert consecutive lines sharing one format"""
+        if lines:
+            cursor.setCharFormat(self._formats[log_type])
+            cursor.insertText("".join(lines))
+
     def _start_typer(self, text, log_type, wrap):
         """Start typewriter effect"""
-        if self._typer_thread and self._typer_thread.isRunning():
-            self._typer_thread.stop()
-            self._typer_thread.wait()
+        self._flush_pending()
+        if self._typer and self._typer.isRunning():
+            self._typer.stop()
 
         cursor = self.text_edit.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(self.LOG_COLORS.get(log_type, "#FFFFFF")))
-
-        ts = datetime.now().strftime("%H:%M:%S")
-        prefix = self.LOG_PREFIX.get(log_type, "INFO")
-        header = f"[{ts}] [{prefix}] "
+        fmt = self._formats.get(log_type) or self._formats["info"]
+        prefix = self._prefix_str.get(log_type) or self._prefix_str["info"]
+        header = f"[{self._timestamp()}] {prefix}"
 
         self._clear_status_line()
         self._status_start_pos = cursor.position() if not wrap else None
@@ -251,22 +360,20 @@ class CmdLogWidget(QWidget):
         cursor.insertText(header)
         self.text_edit.setTextCursor(cursor)
 
-        self._typer_thread = TyperThread(text)
-        self._typer_thread.char_ready.connect(
+        self._typer = Typer(text)
+        self._typer.char_ready.connect(
             lambda ch: self._append_char(ch, fmt)
         )
-        self._typer_thread.finished.connect(
+        self._typer.finished.connect(
             lambda: self._on_typer_finished(wrap)
         )
-        self._typer_thread.start()
+        self._typer.start()
 
     def _append_char(self, ch, fmt):
-        """Append character"""
-        cursor = self.text_edit.textCursor()
+        """Append character chunk"""
+        cursor = self._typer_cursor
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.setCharFormat(fmt)
-        cursor.insertText(ch)
-        self.text_edit.setTextCursor(cursor)
+        cursor.insertText(ch, fmt)
         self.text_edit.ensureCursorVisible()
 
     def _on_typer_finished(self, wrap):
@@ -280,6 +387,8 @@ class CmdLogWidget(QWidget):
 
     def clear(self):
         """Clear log"""
+        self._flush_timer.stop()
+        self._pending.clear()
         self.text_edit.clear()
         self._status_start_pos = None
 
@@ -295,7 +404,20 @@ class CmdLogWidget(QWidget):
         size_small = get_font_size('size_small', 11)
         size_normal = get_font_size('size_normal', 12)
 
-        self.setStyleSheet(f"""
+        key = (btn_r, cmd_bg, card_bg, hover_bg, border, text_primary, size_small, size_normal)
+        qss = self._qss_cache.get(key)
+        if qss is None:
+            qss = self._qss_cache[key] = self._build_qss(*key)
+        # Re-applying an identical stylesheet still forces Qt to re-parse it
+        if qss is not self._applied_qss:
+            self.setStyleSheet(qss)
+            self._applied_qss = qss
+
+    @staticmethod
+    def _build_qss(btn_r: int, cmd_bg: str, card_bg: str, hover_bg: str, border: str,
+                   text_primary: str, size_small: int, size_normal: int) -> str:
+        """Build the console stylesheet for the given theme values"""
+        return f"""
             QTextEdit {{
                 background-color: {cmd_bg};
                 color: {text_primary};
@@ -320,7 +442,7 @@ class CmdLogWidget(QWidget):
             QPushButton:hover {{
                 background-color: {hover_bg};
             }}
-        """)
+        """
 
     def refresh_style(self):
         """Refresh style (called when theme changes)"""
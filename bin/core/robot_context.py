@@ -24,8 +24,10 @@ Usage:
         robot.run_action("stand")
 """
 
-from typing import Optional, Dict, Any, TYPE_CHECKING
-from bin.core.logger import log_info, log_error, log_debug, log_warning
+import sys
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, TYPE_CHECKING
+from bin.core.logger import log_info, log_error, log_debug, log_warning, is_debug_enabled
 from design.service.service_registry import ServiceRegistry
 from design.service.service_router import ServiceRouter
 from design.service.adapters.unitree_sdk2.adapter import UnitreeAdapter
@@ -49,13 +51,20 @@ class RobotContext:
 
     # Global state
     _current_robot_type: str = "go2"
+    _current_brand: str = "unitree"  # Derived from _current_robot_type in set_robot_type
+    _current_adapter_name: str = "unitree_sdk2"
     _current_robot_model: Optional['BaseRobotModel'] = None
     _initialized: bool = False
     _service_registry: ServiceRegistry = ServiceRegistry()
     _service_router: ServiceRouter = ServiceRouter(_service_registry)
-
-    # Robot type to brand mapping
-    ROBOT_BRAND_MAP: Dict[str, str] = {
+    # Last connected adapter and its (adapter_name, robot_type) key
+    _cached_adapter: Optional[Any] = None
+    _cached_adapter_key: Optional[tuple] = None
+    # Routed run_action of the cached adapter, resolved on first use
+    _run_action_fn: Optional[Any] = None
+
+    # Robot type to brand mapping (read-only)
+    ROBOT_BRAND_MAP: Mapping[str, str] = MappingProxyType({
         # Unitree robots
         "go2": "unitree",
         "a1": "unitree",
@@ -65,7 +74,7 @@ class RobotContext:
         # Add more brands here as needed
         # "spot": "boston_dynamics",
         # "anymal": "anybotics",
-    }
+    })
 
     # Available robot types per brand
     BRAND_ROBOTS: Dict[str, list] = {
@@ -74,9 +83,12 @@ class RobotContext:
         # "anybotics": ["anymal"],
     }
 
-    BRAND_ADAPTER_MAP: Dict[str, str] = {
+    BRAND_ADAPTER_MAP: Mapping[str, str] = MappingProxyType({
         "unitree": "unitree_sdk2",
-    }
+    })
+
+    # Model classes resolved by _create_model_for_brand (brand -> class)
+    _BRAND_MODEL_CLASSES: Dict[str, type] = {}
 
     @classmethod
     def set_robot_type(cls, robot_type: str) -> bool:
@@ -89,7 +101,8 @@ class RobotContext:
         Returns:
             True if successfully set, False otherwise
         """
-        robot_type = robot_type.lower()
+        # Interned so it is the same object as the ROBOT_BRAND_MAP key
+        robot_type = sys.intern(robot_type.lower())
 
         # Check if robot type is supported
         if robot_type not in cls.ROBOT_BRAND_MAP:
@@ -98,12 +111,16 @@ class RobotContext:
 
         # If same type and already initialized, skip
         if robot_type == cls._current_robot_type and cls._current_robot_model is not None:
-            log_debug(f"Robot type already set to: {robot_type}")
+            if is_debug_enabled():
+                log_debug(f"Robot type already set to: {robot_type}")
             return True
 
         cls._current_robot_type = robot_type
+        cls._current_brand = cls.ROBOT_BRAND_MAP[robot_type]
+        cls._current_adapter_name = cls.BRAND_ADAPTER_MAP.get(cls._current_brand, "unitree_sdk2")
         cls._current_robot_model = None  # Clear old model
         cls._initialized = False
+        cls._drop_adapter_cache()
 
         log_info(f"Robot type set to: {robot_type} (brand: {cls.get_current_brand()})")
         return True
@@ -116,7 +133,7 @@ class RobotContext:
     @classmethod
     def get_current_brand(cls) -> str:
         """Get the brand of the current robot type."""
-        return cls.ROBOT_BRAND_MAP.get(cls._current_robot_type, "unitree")
+        return cls._current_brand
 
     @classmethod
     def get_robot_model(cls, force_reinit: bool = False) -> Optional['BaseRobotModel']:
@@ -164,24 +181,28 @@ class RobotContext:
         Returns:
             Robot model instance
         """
-        if brand == "unitree":
-            from models.unitree import UnitreeModel
-            return UnitreeModel(robot_type)
+        if brand != "unitree":
+            log_warning(f"Unknown brand: {brand}, falling back to unitree")
 
-        # Add more brands here
-        # elif brand == "boston_dynamics":
-        #     from models.boston_dynamics import BostonDynamicsModel
-        #     return BostonDynamicsModel(robot_type)
+        model_class = cls._BRAND_MODEL_CLASSES.get(brand)
+        if model_class is None:
+            # Add more brands here
+            # if brand == "boston_dynamics":
+            #     from models.boston_dynamics import BostonDynamicsModel
+            #     model_class = BostonDynamicsModel
+            from models.unitree import UnitreeModel
+            model_class = cls._BRAND_MODEL_CLASSES[brand] = UnitreeModel
 
-        else:
-            log_warning(f"Unknown brand: {brand}, falling back to unitree")
-            from models.unitree import UnitreeModel
-            return UnitreeModel(robot_type)
+        return model_class(robot_type)
 
     @classmethod
     def _ensure_adapter(cls, brand: str, robot_type: str, force_reinit: bool = False):
         """Ensure adapter is registered and bound to current robot type."""
         adapter_name = cls.BRAND_ADAPTER_MAP.get(brand, "unitree_sdk2")
+        key = (adapter_name, robot_type)
+        if not force_reinit and cls._cached_adapter is not None and cls._cached_adapter_key == key:
+            return cls._cached_adapter
+
         adapter = cls._service_registry.get(adapter_name)
 
         if adapter is None:
@@ -196,9 +217,21 @@ class RobotContext:
             adapter.connect(robot_type=robot_type, force_reinit=force_reinit)
         except Exception as e:
             log_error(f"Adapter connect failed ({adapter_name}): {e}")
+            cls._drop_adapter_cache()
             return None
 
+        if adapter is not cls._cached_adapter:
+            cls._run_action_fn = None
+        cls._cached_adapter = adapter
+        cls._cached_adapter_key = key
         return adapter
+
+    @classmethod
+    def _drop_adapter_cache(cls):
+        """Forget the connected adapter and its resolved action dispatch."""
+        cls._cached_adapter = None
+        cls._cached_adapter_key = None
+        cls._run_action_fn = None
 
     @classmethod
     def run_action(cls, action_name: str, **kwargs) -> bool:
@@ -214,14 +247,18 @@ class RobotContext:
         Returns:
             True if action executed successfully, False otherwise
         """
-        brand = cls.get_current_brand()
-        adapter_name = cls.BRAND_ADAPTER_MAP.get(brand, "unitree_sdk2")
-        adapter = cls._ensure_adapter(brand, cls._current_robot_type)
-        if adapter is None:
-            log_error(f"Cannot execute action '{action_name}': Adapter unavailable")
-            return False
+        dispatch = cls._run_action_fn
+        if dispatch is None:
+            adapter = cls._ensure_adapter(cls._current_brand, cls._current_robot_type)
+            if adapter is None:
+                log_error(f"Cannot execute action '{action_name}': Adapter unavailable")
+                return False
         try:
-            return bool(cls._service_router.run_action(adapter_name, action_name, **kwargs))
+            if dispatch is None:
+                # Resolve the route once; reused until the adapter binding changes
+                adapter = cls._service_router.get_adapter(cls._current_adapter_name)
+                dispatch = cls._run_action_fn = adapter.run_action
+            return bool(dispatch(action_name, **kwargs))
         except Exception as e:
             log_error(f"Action routing failed ({action_name}): {e}")
             robot = cls.get_robot_model()
@@ -237,9 +274,8 @@ class RobotContext:
         Returns:
             Sensor data dictionary
         """
-        brand = cls.get_current_brand()
-        adapter_name = cls.BRAND_ADAPTER_MAP.get(brand, "unitree_sdk2")
-        adapter = cls._ensure_adapter(brand, cls._current_robot_type)
+        adapter_name = cls._current_adapter_name
+        adapter = cls._ensure_adapter(cls._current_brand, cls._current_robot_type)
         if adapter is None:
             return {'error': 'No robot model available'}
         try:
@@ -254,9 +290,8 @@ class RobotContext:
     @classmethod
     def stop(cls):
         """Stop the current robot."""
-        brand = cls.get_current_brand()
-        adapter_name = cls.BRAND_ADAPTER_MAP.get(brand, "unitree_sdk2")
-        adapter = cls._ensure_adapter(brand, cls._current_robot_type)
+        adapter_name = cls._current_adapter_name
+        adapter = cls._ensure_adapter(cls._current_brand, cls._current_robot_type)
         if adapter is None:
             return
         try:
@@ -291,6 +326,7 @@ class RobotContext:
         """Reset the context to initial state."""
         cls._current_robot_model = None
         cls._initialized = False
+        cls._drop_adapter_cache()
         cls._service_registry = ServiceRegistry()
         cls._service_router = ServiceRouter(cls._service_registry)
         log_debug("Robot context reset")
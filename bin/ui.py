@@ -22,7 +22,7 @@ from bin.core.simulation_thread import SimulationThread
 from bin.core.config_manager import ConfigManager
 from bin.core.data_manager import get_value, load_data, up_data
 from bin.core.theme_manager import get_color, get_font_size, set_theme
-from bin.core.logger import CmdLogWidget, log_info, log_success, log_warning, log_error, log_debug
+from bin.core.logger import CmdLogWidget, log_info, log_success, log_warning, log_error, log_debug, set_debug_enabled
 from bin.core.localisation import get_localisation, tr
 from bin.core.robot_context import RobotContext
 
@@ -99,6 +99,8 @@ class MainWindow(QMainWindow):
         self.module_palette.node_requested.connect(self._on_node_requested)
 
         # Graph editor
+        verbose = self.config.get_bool('DEBUG', 'verbose_logging', fallback=True)
+        set_debug_enabled(verbose)
         self.graph_scene = GraphScene()
         self.graph_view = GraphView(self.graph_scene)
 
@@ -142,7 +144,7 @@ class MainWindow(QMainWindow):
             text_primary = get_color('text_primary', '#ffffff')
             text_secondary = get_color('text_secondary', '#cccccc')
             hover_bg = get_color('hover_bg', '#3d3d3d')
-        except:
+        except Exception:
             # Fallback
             bg = '#1e1e1e'
             card_bg = '#2d2d2d'
@@ -363,6 +365,8 @@ class MainWindow(QMainWindow):
     def _on_export_code(self):
         """Export code"""
         log_info(tr("log.export_code", "Export code"))
+        # Code regeneration is debounced; bring the editor up to date first
+        self.graph_scene.flush_code()
         code = self.code_editor.get_code()
         QMessageBox.information(
             self,
@@ -546,7 +550,8 @@ class MainWindow(QMainWindow):
         set_theme(theme)
         if persist:
             self.config.set('PREFERENCES', 'theme', theme, config_type='user')
-            self.config.save_user_config()
+            if not self.config.save_user_config():
+                log_warning(tr("log.config_save_failed", "Failed to save user settings"))
         self._refresh_theme()
         self._sync_theme_button()
 
@@ -82,6 +82,10 @@ ERROR_CODES: Dict[str, ErrorCodeEntry] = {
         "E2008", "semantic", "error",
         "Type mismatch on parameter '{param}': expected {expected}, got {actual}",
     ),
+    "E2009": ErrorCodeEntry(
+        "E2009", "lowering", "error",
+        "Canvas graph could not be lowered to IR: {error}",
+    ),
 
     # ---------- W3xxx: Warnings ----------
     "W3001": ErrorCodeEntry(
@@ -2,17 +2,34 @@
 # -*- coding: utf-8 -*-
 """Runtime node executor."""
 
-from typing import Dict, Any, Optional
-from bin.core.logger import log_info, log_error, log_debug, log_warning
+import heapq
+from typing import Dict, Any, List, NamedTuple, Optional
+from bin.core.logger import log_info, log_error, log_debug, log_warning, is_debug_enabled
+
+
+class Connection(NamedTuple):
+    """Directed edge between two node ports."""
+
+    from_node: str
+    from_port: str
+    to_node: str
+    to_port: str
 
 
 class NodeExecutor:
     """Execute a simple DAG-like node graph."""
 
+    # to_code() templates
+    _CODE_HEADER = "# Auto-generated workflow code\n\ndef execute_workflow():\n"
+    _NODE_TEMPLATE = "    # {type}: {id}\n    # TODO: implement {type}\n\n"
+    _CODE_FOOTER = "if __name__ == '__main__':\n    execute_workflow()"
+
     def __init__(self):
         self.nodes = []
         self.connections = []
         self.execution_order = []
+        self._nodes_by_id: Dict[str, Dict[str, Any]] = {}
+        self._inbound: Dict[str, List[Connection]] = {}  # to_node -> connections
 
     def add_node(self, node_id: str, node_type: str, node_data: Dict[str, Any]):
         node = {
@@ -23,37 +40,50 @@ class NodeExecutor:
             "outputs": [],
         }
         self.nodes.append(node)
-        log_debug(f"add node: {node_id} ({node_type})")
+        self._nodes_by_id.setdefault(node_id, node)  # First node wins, as in a list scan
+        if is_debug_enabled():
+            log_debug(f"add node: {node_id} ({node_type})")
 
     def add_connection(self, from_node: str, from_port: str, to_node: str, to_port: str):
-        connection = {
-            "from": {"node": from_node, "port": from_port},
-            "to": {"node": to_node, "port": to_port},
-        }
+        connection = Connection(from_node, from_port, to_node, to_port)
         self.connections.append(connection)
-        log_debug(f"add connection: {from_node}.{from_port} -> {to_node}.{to_port}")
+        self._inbound.setdefault(to_node, []).append(connection)
+        if is_debug_enabled():
+            log_debug(f"add connection: {from_node}.{from_port} -> {to_node}.{to_port}")
 
     def build_execution_order(self) -> bool:
-        graph = {node["id"]: [] for node in self.nodes}
-        in_degree = {node["id"]: 0 for node in self.nodes}
+        if len(self.nodes) <= 1 and not self.connections:
+            # Nothing to sort
+            self.execution_order = [node["id"] for node in self.nodes]
+            return True
+
+        # Encode nodes as contiguous ints in insertion order; the int doubles as
+        # the heap priority, so ready nodes are released in insertion order
+        ids = list(dict.fromkeys(node["id"] for node in self.nodes))
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        graph = [[] for _ in ids]
+        in_degree = [0] * len(ids)
 
         for conn in self.connections:
-            from_id = conn["from"]["node"]
-            to_id = conn["to"]["node"]
-            if from_id in graph and to_id in graph:
-                graph[from_id].append(to_id)
-                in_degree[to_id] += 1
+            src = index.get(conn.from_node)
+            dst = index.get(conn.to_node)
+            if src is not None and dst is not None:
+                graph[src].append(dst)
+                in_degree[dst] += 1
 
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        heap = [i for i, degree in enumerate(in_degree) if degree == 0]  # Ascending, already a heap
         result = []
 
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
+        # Locals for the hot loop
+        heappop, heappush, emit = heapq.heappop, heapq.heappush, result.append
+        while heap:
+            current = heappop(heap)
+            emit(ids[current])
             for neighbor in graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                degree = in_degree[neighbor] - 1
+                in_degree[neighbor] = degree
+                if degree == 0:
+                    heappush(heap, neighbor)
 
         if len(result) != len(self.nodes):
             log_error("cycle detected in node graph")
@@ -64,6 +94,8 @@ class NodeExecutor:
         return True
 
     def execute(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if not self.nodes:
+            return {}
         if not self.execution_order:
             if not self.build_execution_order():
                 raise RuntimeError("failed to build execution order")
@@ -82,7 +114,8 @@ class NodeExecutor:
             try:
                 output = self._execute_node(node, inputs, context)
                 results[node_id] = output
-                log_debug(f"node {node_id} output: {output}")
+                if is_debug_enabled():
+                    log_debug(f"node {node_id} output: {output}")
             except Exception as exc:
                 log_error(f"node {node_id} failed: {exc}")
                 results[node_id] = {"error": str(exc)}
@@ -90,20 +123,13 @@ class NodeExecutor:
         return results
 
     def _find_node(self, node_id: str) -> Optional[Dict[str, Any]]:
-        for node in self.nodes:
-            if node["id"] == node_id:
-                return node
-        return None
+        return self._nodes_by_id.get(node_id)
 
     def _collect_inputs(self, node_id: str, results: Dict[str, Any]) -> Dict[str, Any]:
         inputs: Dict[str, Any] = {}
-        for conn in self.connections:
-            if conn["to"]["node"] == node_id:
-                from_id = conn["from"]["node"]
-                from_port = conn["from"]["port"]
-                to_port = conn["to"]["port"]
-                if from_id in results:
-                    inputs[to_port] = results[from_id].get(from_port)
+        for conn in self._inbound.get(node_id, ()):
+            if conn.from_node in results:
+                inputs[conn.to_port] = results[conn.from_node].get(conn.from_port)
         return inputs
 
     def _execute_node(self, node: Dict[str, Any], inputs: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
@@ -115,7 +141,9 @@ class NodeExecutor:
 
     def clear(self):
         self.nodes.clear()
+        self._nodes_by_id.clear()
         self.connections.clear()
+        self._inbound.clear()
         self.execution_order.clear()
         log_info("node executor cleared")
 
@@ -123,19 +151,12 @@ class NodeExecutor:
         if not self.execution_order:
             self.build_execution_order()
 
-        code_lines = [
-            "# Auto-generated workflow code",
-            "",
-            "def execute_workflow():",
-        ]
-        for node_id in self.execution_order:
-            node = self._find_node(node_id)
-            if node:
-                code_lines.append(f"    # {node['type']}: {node_id}")
-                code_lines.append(f"    # TODO: implement {node['type']}")
-                code_lines.append("")
-
-        code_lines.append("if __name__ == '__main__':")
-        code_lines.append("    execute_workflow()")
-        return "\n".join(code_lines)
+        nodes_by_id = self._nodes_by_id
+        render = self._NODE_TEMPLATE.format
+        body = "".join(
+            render(type=nodes_by_id[node_id]["type"], id=node_id)
+            for node_id in self.execution_order
+            if node_id in nodes_by_id
+        )
+        return f"{self._CODE_HEADER}{body}{self._CODE_FOOTER}"
 
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Runtime simulation runner."""
 
+import time
 from typing import Any
 from PySide6.QtCore import QThread, Signal
 from bin.core.logger import log_info, log_error
@@ -15,6 +16,9 @@ class SimulationRunner(QThread):
     error_occurred = Signal(str)
     progress_updated = Signal(int, str)
 
+    # Minimum seconds between progress_updated emissions (~30 Hz)
+    PROGRESS_MIN_INTERVAL = 1.0 / 30
+
     def __init__(self, robot_model: Any, action: str, **kwargs):
         super().__init__()
         self.robot_model = robot_model
@@ -22,6 +26,7 @@ class SimulationRunner(QThread):
         self.kwargs = kwargs
         self.running = False
         self._stop_requested = False
+        self._last_progress_time = 0.0
 
     def run(self):
         try:
@@ -46,6 +51,19 @@ class SimulationRunner(QThread):
         if not success:
             raise RuntimeError(f"Action execution failed: {self.action}")
 
+    def _emit_progress(self, percent: int, message: str = "") -> bool:
+        """Emit progress_updated, dropping updates faster than PROGRESS_MIN_INTERVAL.
+
+        Completion (percent >= 100) is always emitted. Subclasses should report
+        progress through this instead of emitting the signal directly.
+        """
+        now = time.monotonic()
+        if percent < 100 and now - self._last_progress_time < self.PROGRESS_MIN_INTERVAL:
+            return False
+        self._last_progress_time = now
+        self.progress_updated.emit(percent, message)
+        return True
+
     def stop(self):
         self._stop_requested = True
         if self.robot_model:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the CmdLogWidget console."""
+
+import sys
+import unittest
+from pathlib import Path
+
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.core.localisation import get_localisation
+from bin.core.logger import CmdLogWidget, Typer
+
+
+def ensure_qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def wait_until(predicate, timeout_ms):
+    for _ in range(timeout_ms // 10):
+        if predicate():
+            return True
+        QTest.qWait(10)
+    return predicate()
+
+
+class TestTyper(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.widget = CmdLogWidget()
+
+    def tearDown(self):
+        if self.widget._typer:
+            self.widget._typer.stop()
+
+    def test_typer_emits_chunks(self):
+        chunks = []
+        typer = Typer("abcdefghijk", interval=1)
+        typer.char_ready.connect(chunks.append)
+        typer.start()
+        wait_until(lambda: not typer.isRunning(), 1000)
+        self.assertEqual(chunks, ["abcdefgh", "ijk"])
+
+    def test_typed_text_reaches_console(self):
+        self.widget._on_log("typed message", "info", True, True)
+        self.assertTrue(wait_until(lambda: not self.widget._typer.isRunning(), 3000))
+        self.assertTrue(self.widget.text_edit.toPlainText().endswith("[INFO] typed message\n"))
+
+    def test_new_message_interrupts_typer(self):
+        self.widget._on_log("first message that is long", "info", True, True)
+        self.widget._on_log("second", "info", True, True)
+        wait_until(lambda: not self.widget._typer.isRunning(), 3000)
+        lines = self.widget.text_edit.toPlainText().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].endswith("[INFO] second"))
+
+
+class TestLogBuffer(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.widget = CmdLogWidget()
+
+    def test_oldest_lines_dropped(self):
+        self.widget.text_edit.document().setMaximumBlockCount(10)
+        for i in range(25):
+            self.widget._append_log(f"line {i}", "info", True)
+        self.widget._flush_pending()
+        lines = self.widget.text_edit.toPlainText().splitlines()
+        self.assertLessEqual(len(lines), 10)
+        self.assertTrue(lines[-1].endswith("line 24"))
+
+    def test_burst_inserted_on_flush(self):
+        for i in range(5):
+            self.widget._on_log(f"line {i}", "info" if i % 2 else "error", True, False)
+        self.assertEqual(self.widget.text_edit.toPlainText(), "")
+        wait_until(lambda: not self.widget._pending, 1000)
+        lines = self.widget.text_edit.toPlainText().splitlines()
+        self.assertEqual([line.split("] ", 2)[2] for line in lines],
+                         [f"line {i}" for i in range(5)])
+        self.assertIn("[ERROR] line 0", lines[0])
+
+    def test_superseded_status_line_skipped(self):
+        self.widget._append_log("progress 1", "info", False)
+        self.widget._append_log("progress 2", "info", False)
+        self.widget._flush_pending()
+        self.assertTrue(self.widget.text_edit.toPlainText().endswith("[INFO] progress 2"))
+        self.widget._append_log("done", "success", True)
+        self.widget._flush_pending()
+        self.assertTrue(self.widget.text_edit.toPlainText().endswith("[SUCCESS] done\n"))
+        self.assertNotIn("progress", self.widget.text_edit.toPlainText())
+
+
+class TestRetranslate(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.widget = CmdLogWidget()
+
+    def test_header_follows_language_change(self):
+        self.widget._title_label.setText("stale")
+        self.widget._clear_btn.setText("stale")
+        loc = get_localisation()
+        loc.load_language(loc.current_language)
+        self.assertEqual(self.widget._title_label.text(), loc.get("console.title", "Console"))
+        self.assertEqual(self.widget._clear_btn.text(), loc.get("console.clear", "Clear"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for GraphScene code-generation caching and scheduling."""
+
+import sys
+import unittest
+from pathlib import Path
+
+from PySide6.QtCore import QPointF
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.components.graph_scene import GraphScene
+from bin.components.code_editor import CodeEditor
+
+
+def ensure_qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+class TestConnectionGraphCache(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.scene = GraphScene()
+        self.editor = CodeEditor()
+        self.scene.set_code_editor(self.editor)
+        self.editor.set_graph_scene(self.scene)
+
+    def _load_chain(self):
+        self.scene.load_workflow({
+            "robot_type": "go2",
+            "nodes": [
+                {"id": 0, "display_name": "Action Execution", "node_type": "action_execution",
+                 "position": {"x": 0, "y": 0}, "ui_selection": "Stand"},
+                {"id": 1, "display_name": "Action Execution", "node_type": "action_execution",
+                 "position": {"x": 300, "y": 0}, "ui_selection": "Sit"},
+            ],
+            "connections": [
+                {"from_node": 0, "from_port": "flow_out", "to_node": 1, "to_port": "flow_in"},
+            ],
+        })
+
+    def test_graph_reused_without_topology_change(self):
+        self._load_chain()
+        first = self.scene._build_connection_graph()
+        self.assertIs(self.scene._build_connection_graph(), first)
+        self.assertEqual(len(first["nodes"]), 2)
+
+    def test_graph_rebuilt_after_node_created(self):
+        self._load_chain()
+        first = self.scene._build_connection_graph()
+        self.scene.create_node("Sensor Input", QPointF(0, 200))
+        second = self.scene._build_connection_graph()
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second["nodes"]), 3)
+
+    def test_graph_rebuilt_after_clear(self):
+        self._load_chain()
+        self.scene._build_connection_graph()
+        self.scene.clear_all_nodes()
+        self.assertEqual(self.scene._build_connection_graph()["nodes"], {})
+
+
+class TestPortIndex(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.scene = GraphScene()
+
+    def test_ports_indexed_on_creation(self):
+        rect = self.scene.create_node("Action Execution", QPointF(0, 0))
+        self.assertEqual(rect._port_index[("in", "flow_in")].data(3), "flow_in")
+        self.assertEqual(rect._port_index[("out", "flow_out")].data(1), "out")
+
+    def test_elif_ports_reindexed_after_removal(self):
+        rect = self.scene.create_node("Logic Control", QPointF(0, 0))
+        rect._add_elif()
+        rect._add_elif()
+        second_out = rect._elif_output_ports[1]
+        rect._elif_remove_btns[0].click()
+        self.assertIs(rect._port_index[("out", "out_elif_0")], second_out)
+        self.assertNotIn(("out", "out_elif_1"), rect._port_index)
+
+
+class TestRegenerateDebounce(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.scene = GraphScene()
+        self.editor = CodeEditor()
+        self.scene.set_code_editor(self.editor)
+        self.calls = 0
+
+        def _count():
+            self.calls += 1
+
+        self.scene._regenerate_code_impl = _count
+
+    def test_burst_coalesced_into_single_regeneration(self):
+        for _ in range(10):
+            self.scene.regenerate_code()
+        self.assertEqual(self.calls, 0)
+        QTest.qWait(self.scene.REGEN_DEBOUNCE_MS * 3)
+        self.assertEqual(self.calls, 1)
+
+    def test_flush_runs_pending_regeneration(self):
+        self.scene.regenerate_code()
+        self.scene.flush_code()
+        self.assertEqual(self.calls, 1)
+        self.assertFalse(self.scene._regen_timer.isActive())
+        self.scene.flush_code()
+        self.assertEqual(self.calls, 1)
+
+    def test_load_workflow_regenerates_immediately(self):
+        self.scene.load_workflow({"nodes": [], "connections": []})
+        self.assertEqual(self.calls, 1)
+
+
+class TestIRResultCache(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.scene = GraphScene()
+        self.editor = CodeEditor()
+        self.scene.set_code_editor(self.editor)
+        self.scene.create_node("Action Execution", QPointF(0, 0))
+        self.calls = 0
+        convert = self.scene._ir_converter.convert
+
+        def _counting_convert(*args, **kwargs):
+            self.calls += 1
+            return convert(*args, **kwargs)
+
+        self.scene._ir_converter.convert = _counting_convert
+
+    def test_unchanged_graph_skips_pipeline(self):
+        self.scene._regenerate_code_impl()
+        code = self.editor.get_code()
+        self.scene._regenerate_code_impl()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.editor.get_code(), code)
+
+    def test_changed_graph_reruns_pipeline(self):
+        self.scene._regenerate_code_impl()
+        self.scene.create_node("Sensor Input", QPointF(0, 200))
+        self.scene._regenerate_code_impl()
+        self.assertEqual(self.calls, 2)
+
+    def test_cache_is_bounded(self):
+        for i in range(self.scene.IR_CACHE_SIZE + 5):
+            self.scene.set_robot_type(f"robot_{i}")
+            self.scene._regenerate_code_impl()
+        self.assertEqual(len(self.scene._ir_cache), self.scene.IR_CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
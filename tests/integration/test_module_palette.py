@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the node library palette."""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.components.module_cards import ModulePalette, _PAYLOAD_BYTES_ROLE
+from bin.core.localisation import get_localisation
+
+
+def ensure_qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def iter_leaf_items(tree):
+    stack = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount())]
+    while stack:
+        item = stack.pop()
+        if item.childCount():
+            stack.extend(item.child(i) for i in range(item.childCount()))
+        else:
+            yield item
+
+
+class TestNodeTreePayload(unittest.TestCase):
+    def setUp(self):
+        ensure_qapp()
+        self.palette = ModulePalette()
+
+    def test_drag_bytes_match_payload(self):
+        checked = 0
+        for item in iter_leaf_items(self.palette.tree):
+            payload = item.data(0, Qt.UserRole)
+            if not payload:
+                continue
+            encoded = item.data(0, _PAYLOAD_BYTES_ROLE)
+            self.assertEqual(json.loads(bytes(encoded)), payload)
+            checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_refresh_style_keeps_tree_items(self):
+        before = list(iter_leaf_items(self.palette.tree))
+        self.palette.refresh_style()
+        after = list(iter_leaf_items(self.palette.tree))
+        self.assertEqual(len(after), len(before))
+        for old, new in zip(before, after):
+            self.assertIs(old, new)
+
+    def test_language_change_retranslates_labels(self):
+        root = self.palette.tree.topLevelItem(0)
+        expected = root.text(0)
+        root.setText(0, "stale")
+        get_localisation().language_changed.emit(get_localisation().current_language)
+        self.assertEqual(root.text(0), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for ConfigManager on top of the shared DataManager cache."""
+
+import configparser
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.core.config_manager import ConfigManager
+from bin.core.data_manager import get_data_manager
+
+
+class TestConfigManagerReload(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = get_data_manager()
+        self.cm = ConfigManager(config_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.dm.flush(timeout=5)
+        self.dm.clear_cache()
+        self.tmp.cleanup()
+
+    def _read_disk(self, path):
+        self.assertTrue(self.dm.flush(timeout=5))
+        config = configparser.ConfigParser()
+        config.read(path, encoding="utf-8")
+        return config
+
+    def test_set_after_reload_is_saved(self):
+        self.dm.reload_all()
+        self.cm.set("UI", "probe_key", "1")
+        self.cm.save_system_config()
+        self.assertEqual(self._read_disk(self.cm.system_config_path).get("UI", "probe_key"), "1")
+
+    def test_set_after_clear_cache_is_saved(self):
+        self.dm.clear_cache()
+        self.cm.set("CUSTOM", "probe_key", "2", config_type="user")
+        self.cm.save_user_config()
+        self.assertEqual(self._read_disk(self.cm.user_config_path).get("CUSTOM", "probe_key"), "2")
+
+    def test_get_follows_reloaded_file(self):
+        self.cm.set("UI", "probe_key", "1")
+        self.dm.reload_all()
+        self.assertIsNone(self.cm.get("UI", "probe_key"))
+        self.assertIs(self.cm.system_config, self.dm.read_ini(str(self.cm.system_config_path)))
+
+    def test_derived_caches_dropped_after_reload(self):
+        self.assertEqual(self.cm.get_available_robots(), ["go2", "a1", "b1"])
+        self.dm.up_ini(str(self.cm.system_config_path), "SIMULATION", "available_robots", "go2")
+        self.dm.reload_all()
+        self.assertEqual(self.cm.get_available_robots(), ["go2"])
+
+
+class TestConfigManagerSave(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = get_data_manager()
+        self.cm = ConfigManager(config_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.dm.flush(timeout=5)
+        self.dm.clear_cache()
+        self.tmp.cleanup()
+
+    def test_save_is_on_disk_when_it_returns(self):
+        self.cm.set("UI", "probe_key", "1")
+        self.assertTrue(self.cm.save_system_config())
+        config = configparser.ConfigParser()
+        config.read(self.cm.system_config_path, encoding="utf-8")
+        self.assertEqual(config.get("UI", "probe_key"), "1")
+
+    def test_save_reports_write_failure(self):
+        self.cm.user_config_path.unlink()
+        self.cm.user_config_path.mkdir()
+        self.cm.set("CUSTOM", "probe_key", "1", config_type="user")
+        self.assertFalse(self.cm.save_user_config())
+        self.cm.user_config_path.rmdir()
+        self.assertTrue(self.cm.save_user_config())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for the DataManager INI/JSON cache."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.core.data_manager import DataManager
+
+
+class TestDataManagerWrites(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = DataManager()
+
+    def tearDown(self):
+        self.dm.flush(timeout=5)
+        self.dm.clear_cache()
+        self.tmp.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_unchanged_json_not_rewritten(self):
+        path = self._path("data.json")
+        self.assertTrue(self.dm.up_json(path, data={"a": 1}))
+        self.assertTrue(self.dm.flush(timeout=5))
+        os.utime(path, ns=(0, 0))
+        self.assertTrue(self.dm.up_json(path, data={"a": 1}))
+        self.assertTrue(self.dm.flush(timeout=5))
+        self.assertEqual(os.stat(path).st_mtime_ns, 0)
+
+    def test_changed_json_rewritten(self):
+        path = self._path("data.json")
+        self.dm.up_json(path, data={"a": 1})
+        self.dm.up_json(path, key="b", value=2)
+        self.assertEqual(self.dm.load_json(path, force_reload=True), {"a": 1, "b": 2})
+
+    def test_flush_writes_latest_content(self):
+        path = self._path("data.json")
+        for i in range(5):
+            self.dm.up_json(path, key="n", value=i)
+        self.assertTrue(self.dm.flush(timeout=5))
+        with open(path, encoding="utf-8") as f:
+            self.assertIn('"n": 4', f.read())
+
+    def test_write_error_reported_by_flush(self):
+        path = self._path("blocked.json")
+        os.mkdir(path)
+        self.assertTrue(self.dm.up_json(path, data={"a": 1}, merge=False))
+        self.assertFalse(self.dm.flush(timeout=5, file_path=path))
+        self.assertFalse(self.dm.flush(timeout=5))
+        os.rmdir(path)
+        self.dm.up_json(path, data={"a": 1}, merge=False)
+        self.assertTrue(self.dm.flush(timeout=5, file_path=path))
+        self.assertTrue(self.dm.flush(timeout=5))
+
+    def test_ini_roundtrip(self):
+        path = self._path("data.ini")
+        self.assertTrue(self.dm.up_ini(path, "S", "k", 3))
+        self.dm.clear_cache(path)
+        self.assertEqual(self.dm.get_ini_value(path, "S", "k", value_type=int), 3)
+
+
+class TestDataManagerJsonReads(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "data.json")
+        self.dm = DataManager()
+        self.dm.up_json(self.path, data={"items": [1, 2]})
+
+    def tearDown(self):
+        self.dm.flush(timeout=5)
+        self.dm.clear_cache()
+        self.tmp.cleanup()
+
+    def test_read_returns_independent_copy(self):
+        data = self.dm.read_json(self.path)
+        data["items"].append(3)
+        data["extra"] = True
+        self.assertEqual(self.dm.read_json(self.path), {"items": [1, 2]})
+
+    def test_readonly_view_rejects_writes(self):
+        view = self.dm.read_json_readonly(self.path)
+        self.assertEqual(view["items"], [1, 2])
+        with self.assertRaises(TypeError):
+            view["extra"] = True
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for LocalisationManager lookups."""
+
+import json
+import sys
+import tempfile
+import unittest
+import weakref
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.core.localisation import get_localisation
+
+
+class TestLocalisationLookup(unittest.TestCase):
+    def setUp(self):
+        self.loc = get_localisation()
+        self._orig_dir = self.loc._localisation_dir
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(Path(self.tmp.name) / "en.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "toolbar": {"new": "New", "count": 3},
+                "log": {"hello": "Hello {name}", "again": "Hello {name}"},
+                "modules": {"features": ["a", "b"]},
+            }, f)
+        self.loc.set_localisation_dir(self.tmp.name)
+        self.assertTrue(self.loc.load_language("en"))
+
+    def tearDown(self):
+        self.loc.set_localisation_dir(str(self._orig_dir))
+        self.loc.load_language(self.loc.DEFAULT_LANGUAGE)
+        self.tmp.cleanup()
+
+    def test_dotted_lookup(self):
+        self.assertEqual(self.loc.get("toolbar.new"), "New")
+        self.assertEqual(self.loc.get("modules.features"), ["a", "b"])
+
+    def test_non_text_values_return_default(self):
+        self.assertEqual(self.loc.get("toolbar", "x"), "x")
+        self.assertEqual(self.loc.get("toolbar.count", "x"), "x")
+        self.assertEqual(self.loc.get("toolbar.new.deeper", "x"), "x")
+        self.assertEqual(self.loc.get("missing.key", "x"), "x")
+
+    def test_lazy_load_on_first_lookup(self):
+        emitted = []
+        self.loc.language_changed.connect(emitted.append)
+        try:
+            self.loc._loaded = False
+            self.loc._flat = {}
+            self.assertEqual(self.loc.get("toolbar.new"), "New")
+            self.assertTrue(self.loc._loaded)
+            self.assertEqual(emitted, [])
+        finally:
+            self.loc.language_changed.disconnect(emitted.append)
+
+    def test_available_languages_rescanned_after_dir_change(self):
+        self.assertEqual(self.loc.get_available_languages(), {"en": "English"})
+        with tempfile.TemporaryDirectory() as empty:
+            self.loc.set_localisation_dir(empty)
+            self.assertEqual(self.loc.get_available_languages(), {})
+
+    def test_repeated_strings_share_one_object(self):
+        self.assertIs(self.loc.get("log.hello"), self.loc.get("log.again"))
+        self.assertIs(self.loc._translations["log"]["hello"], self.loc.get("log.hello"))
+
+    def test_format_arguments(self):
+        self.assertEqual(self.loc.get("log.hello", name="Go2"), "Hello Go2")
+        self.assertEqual(self.loc.get("log.hello", "fallback", other=1), "fallback")
+
+    def test_cached_format_distinguishes_argument_types(self):
+        self.assertEqual(self.loc.get("log.hello", name=1), "Hello 1")
+        self.assertEqual(self.loc.get("log.hello", name=True), "Hello True")
+        self.assertEqual(self.loc.get("log.hello", name=["x"]), "Hello ['x']")
+
+    def test_objects_formatted_without_caching(self):
+        class Model:
+            robot_type = "go2"
+
+            def __str__(self):
+                return self.robot_type
+
+        model = Model()
+        self.assertEqual(self.loc.get("log.hello", name=model), "Hello go2")
+        model.robot_type = "a1"
+        self.assertEqual(self.loc.get("log.hello", name=model), "Hello a1")
+        ref = weakref.ref(model)
+        del model
+        self.assertIsNone(ref())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for the runtime NodeExecutor."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from design.runtime.node_executor import Connection, NodeExecutor
+
+
+class TestNodeExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = NodeExecutor()
+
+    def _add_chain(self, *node_ids):
+        for node_id in node_ids:
+            self.executor.add_node(node_id, "action", {"name": node_id})
+        for a, b in zip(node_ids, node_ids[1:]):
+            self.executor.add_connection(a, "flow_out", b, "flow_in")
+
+    def test_execution_order_follows_connections(self):
+        self._add_chain("c", "a", "b")
+        self.executor.add_node("d", "sensor", {})
+        self.assertTrue(self.executor.build_execution_order())
+        order = self.executor.execution_order
+        self.assertLess(order.index("c"), order.index("a"))
+        self.assertLess(order.index("a"), order.index("b"))
+        self.assertEqual(sorted(order), ["a", "b", "c", "d"])
+
+    def test_ready_nodes_released_in_insertion_order(self):
+        for node_id in ("root", "x", "y", "z"):
+            self.executor.add_node(node_id, "action", {})
+        self.executor.add_connection("root", "flow_out", "z", "flow_in")
+        self.executor.add_connection("root", "flow_out", "y", "flow_in")
+        self.executor.add_connection("root", "flow_out", "x", "flow_in")
+        self.assertTrue(self.executor.build_execution_order())
+        self.assertEqual(self.executor.execution_order, ["root", "x", "y", "z"])
+
+    def test_connections_stored_as_records(self):
+        self._add_chain("a", "b")
+        self.assertEqual(self.executor.connections, [Connection("a", "flow_out", "b", "flow_in")])
+        self.assertEqual(self.executor.connections[0].to_port, "flow_in")
+
+    def test_cycle_rejected(self):
+        self._add_chain("a", "b")
+        self.executor.add_connection("b", "flow_out", "a", "flow_in")
+        self.assertFalse(self.executor.build_execution_order())
+        with self.assertRaises(RuntimeError):
+            self.executor.execute()
+
+    def test_execute_collects_inputs(self):
+        class EchoExecutor(NodeExecutor):
+            def _execute_node(self, node, inputs, context):
+                return {"value": node["id"], "inputs": inputs}
+
+        executor = EchoExecutor()
+        for node_id in ("a", "b", "c"):
+            executor.add_node(node_id, "action", {})
+        executor.add_connection("a", "value", "c", "left")
+        executor.add_connection("b", "value", "c", "right")
+        results = executor.execute()
+        self.assertEqual(results["c"]["inputs"], {"left": "a", "right": "b"})
+        self.assertEqual(results["a"]["inputs"], {})
+
+    def test_to_code_lists_nodes_in_order(self):
+        self._add_chain("a", "b")
+        code = self.executor.to_code()
+        self.assertLess(code.index("# action: a"), code.index("# action: b"))
+        self.assertTrue(code.endswith("    execute_workflow()"))
+
+    def test_single_node_fast_path(self):
+        self.executor.add_node("only", "action", {})
+        self.assertTrue(self.executor.build_execution_order())
+        self.assertEqual(self.executor.execution_order, ["only"])
+        self.executor.add_connection("only", "flow_out", "only", "flow_in")
+        self.assertFalse(self.executor.build_execution_order())
+
+    def test_clear(self):
+        self._add_chain("a", "b")
+        self.executor.execute()
+        self.executor.clear()
+        self.assertEqual(self.executor.execute(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
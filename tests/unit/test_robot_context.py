@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for RobotContext robot selection and adapter caching."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bin.core.robot_context import RobotContext
+
+
+class TestRobotContext(unittest.TestCase):
+    def setUp(self):
+        RobotContext.reset()
+        RobotContext.set_robot_type("go2")
+
+    def tearDown(self):
+        RobotContext.reset()
+        RobotContext.set_robot_type("go2")
+
+    def test_unknown_type_falls_back_to_go2(self):
+        RobotContext.set_robot_type("B1")
+        self.assertEqual(RobotContext.get_robot_type(), "b1")
+        RobotContext.set_robot_type("nonexistent")
+        self.assertEqual(RobotContext.get_robot_type(), "go2")
+        self.assertEqual(RobotContext.get_current_brand(), "unitree")
+
+    def test_adapter_connected_once_per_robot_type(self):
+        adapter = RobotContext._ensure_adapter("unitree", "go2")
+        with mock.patch.object(adapter, "connect", wraps=adapter.connect) as connect:
+            self.assertIs(RobotContext._ensure_adapter("unitree", "go2"), adapter)
+            self.assertIs(RobotContext._ensure_adapter("unitree", "go2"), adapter)
+            connect.assert_not_called()
+            RobotContext._ensure_adapter("unitree", "go2", force_reinit=True)
+            self.assertEqual(connect.call_count, 1)
+
+    def test_adapter_rebound_after_robot_change(self):
+        adapter = RobotContext._ensure_adapter("unitree", "go2")
+        RobotContext.set_robot_type("a1")
+        with mock.patch.object(adapter, "connect", wraps=adapter.connect) as connect:
+            RobotContext._ensure_adapter("unitree", "a1")
+            connect.assert_called_once_with(robot_type="a1", force_reinit=False)
+
+    def test_action_route_resolved_once_per_binding(self):
+        router = RobotContext._service_router
+        adapter = RobotContext._ensure_adapter("unitree", "go2")
+        with mock.patch.object(adapter, "run_action", return_value=True), \
+                mock.patch.object(router, "get_adapter", wraps=router.get_adapter) as get_adapter:
+            RobotContext.run_action("stand")
+            RobotContext.run_action("sit")
+            self.assertEqual(get_adapter.call_count, 1)
+            RobotContext.set_robot_type("a1")
+            RobotContext.run_action("stand")
+            self.assertEqual(get_adapter.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
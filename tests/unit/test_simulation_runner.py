@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for SimulationRunner progress reporting."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from design.runtime.simulation_runner import SimulationRunner
+
+
+class TestProgressThrottle(unittest.TestCase):
+    def setUp(self):
+        self.runner = SimulationRunner(robot_model=None, action="stand")
+        self.updates = []
+        self.runner.progress_updated.connect(lambda pct, msg: self.updates.append(pct))
+
+    def test_burst_is_throttled(self):
+        for pct in range(50):
+            self.runner._emit_progress(pct)
+        self.assertEqual(self.updates, [0])
+
+    def test_completion_always_emitted(self):
+        self.runner._emit_progress(10)
+        self.runner._emit_progress(100, "done")
+        self.assertEqual(self.updates, [10, 100])
+
+
+if __name__ == "__main__":
+    unittest.main()